@@ -0,0 +1,49 @@
+"""
+Import-time benchmark for the src package.
+
+Imports every src.problem_* module in a fresh interpreter under
+``python -X importtime`` and reports the self and cumulative import time of
+each one, along with anything written to stdout. The empty src package is
+listed first as a baseline: a module that does no work at import time should
+print nothing and cost about as much as that baseline.
+
+Run from the repository root with:
+    python -m benchmarks.bench_import_time
+"""
+import subprocess
+import sys
+
+MODULES = ["src"] + [f"src.problem_{n}" for n in range(1, 8)]
+
+
+def import_times(module):
+    """
+    Import module in a fresh interpreter.
+
+    Returns:
+        (int, int, str): Self and cumulative import time in microseconds and
+                         whatever the import wrote to stdout.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split(":", 1)[-1].split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[0]), int(fields[1]), result.stdout
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def main():
+    print(f"  {'module':<14} {'self us':>8} {'cumul. us':>10}  stdout")
+    for module in MODULES:
+        self_us, cumulative_us, stdout = import_times(module)
+        print(f"  {module:<14} {self_us:>8} {cumulative_us:>10}  {stdout!r}")
+
+
+if __name__ == "__main__":
+    main()
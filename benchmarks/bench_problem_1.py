@@ -0,0 +1,109 @@
+"""
+Benchmarks for problem_1 (floored square root).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_1
+"""
+import random
+import timeit
+from array import array
+
+from src.problem_1 import SqrtCache, _recursive_sqrt, sqrt, sqrt_big, sqrt_many
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the ndarray input is skipped without it
+    np = None
+
+
+def bench_sqrt_many(size=100_000, repeat=3):
+    """
+    Compare a Python loop of sqrt calls against the batched sqrt_many.
+    """
+    values = [random.randrange(2**62) for _ in range(size)]
+    inputs = {"list": values, "array('q')": array("q", values)}
+    if np is not None:
+        inputs["ndarray"] = np.array(values, dtype=np.int64)
+
+    loop = min(
+        timeit.repeat(lambda: [sqrt(v) for v in values], number=1, repeat=repeat)
+    )
+    print(f"sqrt_many on {size:,} 62-bit values")
+    print(f"  {'python loop':<12} {loop * 1000:9.2f} ms")
+    for name, batch in inputs.items():
+        took = min(timeit.repeat(lambda: sqrt_many(batch), number=1, repeat=repeat))
+        print(f"  {name:<12} {took * 1000:9.2f} ms  {loop / took:6.1f}x")
+
+
+def _newton_iterations(number):
+    """
+    Number of loop iterations sqrt takes when starting at x = number.
+    """
+    iterations = 0
+    x = number
+    y = (x + number // x) // 2
+    while y < x:
+        x = y
+        y = (x + number // x) // 2
+        iterations += 1
+    return iterations
+
+
+def _best_time(func, number, repeat=3):
+    return min(timeit.repeat(lambda: func(number), number=1, repeat=repeat))
+
+
+def bench_sqrt_big(bit_sizes=(64, 256, 1024, 4096, 16384, 65536, 1_000_000)):
+    """
+    Compare the sqrt Newton-Raphson loop against sqrt_big across input sizes.
+
+    The plain loop is skipped above 16384 bits, where it already takes over a
+    minute per call on full-width divisions.
+    """
+    print("sqrt vs sqrt_big by input size")
+    print(
+        f"  {'bits':>9} {'loop iters':>10} {'loop ms':>10} "
+        f"{'rec. steps':>10} {'rec. ms':>10} {'isqrt ms':>10}"
+    )
+    for bits in bit_sizes:
+        number = random.getrandbits(bits) | (1 << (bits - 1))
+        if bits <= 16384:
+            loop_iters = f"{_newton_iterations(number):,}"
+            loop_ms = f"{_best_time(sqrt, number, repeat=1) * 1000:.3f}"
+        else:
+            loop_iters = loop_ms = "skipped"
+        steps = ((number.bit_length() - 1) // 2).bit_length()
+        rec_ms = _best_time(_recursive_sqrt, number) * 1000
+        big_ms = _best_time(sqrt_big, number) * 1000
+        print(
+            f"  {bits:>9,} {loop_iters:>10} {loop_ms:>10} "
+            f"{steps:>10} {rec_ms:>10.3f} {big_ms:>10.3f}"
+        )
+
+
+def bench_sqrt_cache(calls=200_000, distinct=64):
+    """
+    Compare sqrt against SqrtCache on a workload that repeats a few inputs.
+    """
+    small = [random.randrange(2**20) for _ in range(distinct)]
+    large = [random.randrange(2**40, 2**62) for _ in range(distinct)]
+    print(f"SqrtCache on {calls:,} calls over {distinct} distinct inputs")
+    for name, pool in (("< 2**20", small), (">= 2**40", large)):
+        values = [random.choice(pool) for _ in range(calls)]
+        cached_sqrt = SqrtCache()
+        plain = min(timeit.repeat(lambda: [sqrt(v) for v in values], number=1))
+        cached = min(timeit.repeat(lambda: [cached_sqrt(v) for v in values], number=1))
+        print(
+            f"  {name:<9} sqrt {plain * 1000:8.2f} ms  "
+            f"cached {cached * 1000:8.2f} ms  {plain / cached:6.1f}x"
+        )
+
+
+def main():
+    bench_sqrt_many()
+    bench_sqrt_big()
+    bench_sqrt_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmarks for problem_2 (search in a rotated sorted array).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_2
+"""
+import os
+import random
+import resource
+import tempfile
+import time
+import timeit
+from array import array
+
+from src.problem_2 import (
+    RotatedSortedFile,
+    RotatedSortedIndex,
+    linear_search,
+    rotated_array_search,
+    rotated_array_search_first,
+)
+
+
+def _rotated(size):
+    values = list(range(0, 2 * size, 2))
+    pivot = random.randrange(size)
+    return values[pivot:] + values[:pivot]
+
+
+def bench_repeated_queries(size=1_000_000, queries=100_000, repeat=3):
+    """
+    Compare rotated_array_search against a prebuilt RotatedSortedIndex.
+    """
+    input_list = _rotated(size)
+    targets = [random.randrange(2 * size) for _ in range(queries)]
+    index = RotatedSortedIndex(input_list)
+    sorted_targets = sorted(targets)
+
+    cases = {
+        "rotated_array_search": lambda: [
+            rotated_array_search(input_list, n) for n in targets
+        ],
+        "RotatedSortedIndex.search": lambda: [index.search(n) for n in targets],
+        "search_many (unsorted)": lambda: index.search_many(targets),
+        "search_many (sorted)": lambda: index.search_many(sorted_targets),
+    }
+    print(f"{queries:,} lookups on a rotated array of {size:,}")
+    baseline = None
+    for name, func in cases.items():
+        took = min(timeit.repeat(func, number=1, repeat=repeat))
+        baseline = baseline or took
+        print(f"  {name:<26} {took * 1000:9.2f} ms  {baseline / took:6.1f}x")
+
+
+class CountingList(list):
+    """
+    List that counts element reads, as a proxy for comparisons.
+    """
+
+    reads = 0
+
+    def __getitem__(self, index):
+        CountingList.reads += 1
+        return super().__getitem__(index)
+
+
+def _with_duplicates(size, ratio):
+    """
+    Rotated sorted array where ratio of the elements share one key.
+
+    The run of duplicates is split at a random point by the rotation so the
+    key sits at both ends of the array, which is the hard case for finding
+    the pivot.
+    """
+    duplicates = int(size * ratio)
+    key = (size - duplicates) // 2
+    values = sorted(list(range(size - duplicates)) + [key] * duplicates)
+    pivot = values.index(key) + random.randrange(duplicates + 1)
+    return values[pivot:] + values[:pivot]
+
+
+def bench_duplicates(size=10_000, queries=500):
+    """
+    Report element reads per lookup as the duplicate ratio grows.
+
+    The "missed" column counts lookups where rotated_array_search returned -1
+    for a target that is in the array, because duplicates made it pick the
+    wrong half. rotated_array_search_first pays for find_pivot on every call,
+    RotatedSortedIndex only once.
+    """
+    print(f"Element reads per lookup on {size:,} elements, {queries} lookups")
+    print(f"  {'dups':>5} {'original':>10} {'missed':>7} {'first':>10} {'index':>10}")
+    for ratio in (0.0, 0.1, 0.25, 0.5, 0.75, 0.9):
+        values = _with_duplicates(size, ratio)
+        targets = [random.choice(values) for _ in range(queries)]
+        input_list = CountingList(values)
+        expected = [linear_search(values, n) for n in targets]
+
+        CountingList.reads = 0
+        found = [rotated_array_search(input_list, n) for n in targets]
+        original = CountingList.reads / queries
+        missed = found.count(-1)
+
+        CountingList.reads = 0
+        assert [rotated_array_search_first(input_list, n) for n in targets] == expected
+        first = CountingList.reads / queries
+
+        index = RotatedSortedIndex(input_list)
+        CountingList.reads = 0
+        [index.search(n) for n in targets]
+        indexed = CountingList.reads / queries
+
+        print(
+            f"  {ratio:>5.0%} {original:>10.1f} {missed:>7} "
+            f"{first:>10.1f} {indexed:>10.1f}"
+        )
+
+
+def _faults():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_minflt + usage.ru_majflt
+
+
+def _measure(label, setup, lookup, targets):
+    """
+    Print setup time, per-lookup latency and page faults for one path.
+    """
+    faults = _faults()
+    start = time.perf_counter()
+    searcher = setup()
+    setup_ms = (time.perf_counter() - start) * 1000
+    setup_faults = _faults() - faults
+
+    faults = _faults()
+    start = time.perf_counter()
+    for n in targets:
+        lookup(searcher, n)
+    lookup_us = (time.perf_counter() - start) / len(targets) * 1e6
+    lookup_faults = (_faults() - faults) / len(targets)
+    print(
+        f"  {label:<6} {setup_ms:>10.1f} {setup_faults:>13,} "
+        f"{lookup_us:>11.2f} {lookup_faults:>14.2f}"
+    )
+    return searcher
+
+
+def bench_memory_mapped(size=10_000_000, queries=10_000):
+    """
+    Compare loading an int64 file into a list against searching it mapped.
+    """
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pivot = random.randrange(size)
+            array("q", range(2 * pivot, 2 * size, 2)).tofile(f)
+            array("q", range(0, 2 * pivot, 2)).tofile(f)
+        targets = [random.randrange(2 * size) for _ in range(queries)]
+
+        def load_list():
+            values = array("q")
+            with open(path, "rb") as f:
+                values.fromfile(f, size)
+            return values.tolist()
+
+        print(f"Lookups on a {size * 8 / 2**20:,.0f} MiB int64 file")
+        print(
+            f"  {'path':<6} {'setup ms':>10} {'setup faults':>13} "
+            f"{'us/lookup':>11} {'faults/lookup':>14}"
+        )
+        _measure("list", load_list, rotated_array_search, targets)
+        rotated_file = _measure(
+            "mmap", lambda: RotatedSortedFile(path), RotatedSortedFile.search, targets
+        )
+        rotated_file.close()
+    finally:
+        os.remove(path)
+
+
+def main():
+    bench_repeated_queries()
+    bench_duplicates()
+    bench_memory_mapped()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmarks for problem_3 (rearrange digits for the maximum sum).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_3
+"""
+import os
+import random
+import time
+
+from src.problem_3 import (
+    count_digits,
+    count_digits_parallel,
+    rearrange_digits,
+    rearrange_digits_stream,
+)
+
+
+def _best_time(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_stream(sizes=(10**4, 10**5, 10**6, 10**7)):
+    """
+    Time rearrange_digits against rearrange_digits_stream by digit count.
+
+    rearrange_digits returns big ints, whose multiplications grow faster than
+    linearly, and is skipped above 10**6 digits. ns/digit staying flat shows
+    the streaming mode is linear.
+    """
+    print("rearrange_digits vs rearrange_digits_stream")
+    print(
+        f"  {'digits':>10} {'int ms':>11} {'list ms':>9} "
+        f"{'bytes ms':>9} {'ns/digit':>9}"
+    )
+    for size in sizes:
+        digits = [random.randrange(10) for _ in range(size)]
+        ascii_digits = "".join(map(str, digits)).encode()
+        if size <= 10**6:
+            as_int = f"{_best_time(lambda: rearrange_digits(digits)) * 1000:.1f}"
+        else:
+            as_int = "skipped"
+        from_list = _best_time(lambda: rearrange_digits_stream(digits))
+        from_bytes = _best_time(lambda: rearrange_digits_stream(ascii_digits))
+        print(
+            f"  {size:>10,} {as_int:>11} {from_list * 1000:>9.1f} "
+            f"{from_bytes * 1000:>9.2f} {from_list / size * 1e9:>9.1f}"
+        )
+
+
+def bench_parallel(size=5 * 10**7, max_workers=None):
+    """
+    Report digit-counting speedup by worker count on an ASCII digit buffer.
+
+    Speedup is relative to the serial count_digits; with a single CPU the
+    parallel path can only add process and pickling overhead.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    to_digit = bytes(48 + b % 10 for b in range(256))
+    ascii_digits = random.randbytes(size).translate(to_digit)
+    serial = _best_time(lambda: count_digits(ascii_digits), repeat=1)
+    print(f"Counting {size:,} ASCII digits on {os.cpu_count()} CPUs")
+    print(f"  {'workers':>7} {'ms':>9} {'speedup':>8}")
+    print(f"  {'serial':>7} {serial * 1000:>9.1f} {1:>8.2f}")
+    workers = 1
+    while workers <= max_workers:
+        took = _best_time(
+            lambda: count_digits_parallel(ascii_digits, workers, 4 * 2**20), repeat=1
+        )
+        print(f"  {workers:>7} {took * 1000:>9.1f} {serial / took:>8.2f}")
+        workers *= 2
+
+
+def _sorted_rearrange(digits, base, k):
+    """
+    The obvious alternative: sort, deal with slicing, build with Horner's rule.
+    """
+    ordered = sorted(digits, reverse=True)
+    numbers = []
+    for j in range(k):
+        num = 0
+        for digit in ordered[j::k]:
+            num = num * base + digit
+        numbers.append(num)
+    return numbers
+
+
+def bench_base_and_k(
+    sizes=(10**3, 10**4, 10**5), cases=((10, 2), (16, 4), (256, 8))
+):
+    """
+    Compare the counting engine in rearrange_digits against sorted().
+    """
+    print("rearrange_digits(base, k) vs sorted() + Horner")
+    print(f"  {'digits':>8} {'base':>5} {'k':>3} {'sorted ms':>10} {'engine ms':>10}")
+    for size in sizes:
+        for base, k in cases:
+            digits = [random.randrange(base) for _ in range(size)]
+            assert rearrange_digits(digits, base, k) == _sorted_rearrange(
+                digits, base, k
+            )
+            by_sort = _best_time(lambda: _sorted_rearrange(digits, base, k))
+            engine = _best_time(lambda: rearrange_digits(digits, base, k))
+            print(
+                f"  {size:>8,} {base:>5} {k:>3} "
+                f"{by_sort * 1000:>10.2f} {engine * 1000:>10.2f}"
+            )
+
+
+def main():
+    bench_stream()
+    bench_parallel()
+    bench_base_and_k()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmarks for problem_4 (sort an array of 0s, 1s and 2s).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_4
+"""
+import os
+import random
+import time
+from array import array
+from operator import itemgetter
+
+from src.problem_4 import (
+    partition_by_key,
+    sort_012,
+    sort_012_counting,
+    sort_012_parallel,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the ndarray input is skipped without it
+    np = None
+
+
+def _time_once(func, data):
+    # Most of these sort in place, so each run gets a fresh copy
+    data = data.copy() if hasattr(data, "copy") else data[:]
+    start = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start
+
+
+def bench_counting(size=5_000_000):
+    """
+    Compare the Dutch-flag sort_012 against sort_012_counting.
+    """
+    values = random.choices(range(3), k=size)
+    inputs = {
+        "list": values,
+        "bytearray": bytearray(values),
+        "array('b')": array("b", values),
+    }
+    if np is not None:
+        inputs["ndarray"] = np.array(values, dtype=np.int8)
+
+    print(f"Sorting {size:,} values of 0, 1 and 2")
+    print(f"  {'input':<11} {'sort_012 ms':>12} {'counting ms':>12} {'speedup':>8}")
+    for name, data in inputs.items():
+        swaps = _time_once(sort_012, data)
+        counting = _time_once(sort_012_counting, data)
+        print(
+            f"  {name:<11} {swaps * 1000:>12.1f} {counting * 1000:>12.2f} "
+            f"{swaps / counting:>8.1f}x"
+        )
+
+
+def bench_partition_by_key(size=1_000_000, ks=(3, 16, 256)):
+    """
+    Compare partition_by_key, in place and stable, against sorted(key=...).
+    """
+    key = itemgetter(0)
+    print(f"Partitioning {size:,} (priority, id) records")
+    print(f"  {'k':>4} {'sorted ms':>10} {'in place ms':>12} {'stable ms':>10}")
+    for k in ks:
+        items = [(random.randrange(k), i) for i in range(size)]
+        by_sort = _time_once(lambda data: sorted(data, key=key), items)
+        in_place = _time_once(lambda data: partition_by_key(data, key, k), items)
+        stable = _time_once(lambda data: partition_by_key(data, key, k, True), items)
+        print(
+            f"  {k:>4} {by_sort * 1000:>10.1f} {in_place * 1000:>12.1f} "
+            f"{stable * 1000:>10.1f}"
+        )
+
+
+def bench_parallel(size=50_000_000, max_workers=None):
+    """
+    Report sort_012_parallel throughput by worker count on a bytearray.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    to_012 = bytes(b % 3 for b in range(256))
+    data = bytearray(random.randbytes(size).translate(to_012))
+    print(f"Sorting {size:,} bytes of 0, 1 and 2 on {os.cpu_count()} CPUs")
+    print(f"  {'mode':<14} {'ms':>9} {'M elements/s':>13}")
+    rows = [("counting", sort_012_counting)]
+    workers = 1
+    while workers <= max_workers:
+        label = f"{workers} workers"
+        rows.append((label, lambda data, w=workers: sort_012_parallel(data, w)))
+        workers *= 2
+    for label, func in rows:
+        took = _time_once(func, data)
+        print(f"  {label:<14} {took * 1000:>9.1f} {size / took / 1e6:>13.1f}")
+
+
+def main():
+    bench_counting()
+    bench_partition_by_key()
+    bench_parallel()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Benchmarks for problem_5 (autocomplete with a Trie).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_5
+"""
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from src.problem_5 import ConcurrentTrie, FrozenTrie, RadixTrie, Trie, TrieNode
+
+SYLLABLES = ["an", "ti", "fun", "ct", "ion", "ing", "tri", "go", "no", "me", "try"]
+SYLLABLES += ["pro", "duct", "max", "mini", "ul", "tra", "s", "x", "er", "lite"]
+
+
+def make_words(count, seed=0):
+    """
+    Generate count distinct product-name-like words from common syllables.
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randrange(2, 7))))
+    return sorted(words)
+
+
+class _DictTrieNode(TrieNode):
+    """
+    TrieNode with an attribute dictionary, like TrieNode before __slots__.
+    """
+
+
+def _build_dict_trie(words):
+    trie = Trie()
+    trie.root = _DictTrieNode()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+
+def _build(trie_class, words):
+    trie = trie_class()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+
+def bench_memory(count=200_000):
+    """
+    Report tracemalloc bytes per word and build time for each trie backend.
+
+    Build times are measured with tracemalloc running, so they are inflated
+    and only comparable with each other.
+    """
+    words = make_words(count)
+    words.reverse()  # so insertion order is not the sorted best case
+    backends = {
+        "Trie (dict nodes)": _build_dict_trie,
+        "Trie": lambda words: _build(Trie, words),
+        "RadixTrie": lambda words: _build(RadixTrie, words),
+    }
+    print(f"Building a trie of {count:,} words")
+    print(f"  {'backend':<18} {'bytes/word':>11} {'build ms':>9}")
+    for name, build in backends.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        trie = build(words)
+        took = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del trie
+        print(f"  {name:<18} {used / count:>11.0f} {took * 1000:>9.0f}")
+
+
+def bench_completions(count=200_000, prefixes=("a", "pro", "fun")):
+    """
+    Time the first 10 completions, all completions and the top 10 by weight.
+    """
+    rng = random.Random(1)
+    trie = Trie()
+    for word in make_words(count):
+        trie.insert(word, rng.randrange(1, 1000))
+
+    print(f"Completions on a trie of {count:,} words")
+    print(
+        f"  {'prefix':<7} {'matches':>8} {'all ms':>8} "
+        f"{'limit=10 ms':>12} {'top_k(10) ms':>13}"
+    )
+    for prefix in prefixes:
+        node = trie.find(prefix)
+        timings = []
+        for complete in (
+            lambda: node.suffixes(),
+            lambda: node.suffixes(limit=10),
+            lambda: node.top_k(10),
+        ):
+            start = time.perf_counter()
+            complete()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(
+            f"  {prefix:<7} {len(node.suffixes()):>8,} {timings[0]:>8.2f} "
+            f"{timings[1]:>12.3f} {timings[2]:>13.3f}"
+        )
+
+
+def bench_frozen(count=200_000, lookups=10_000):
+    """
+    Compare rebuilding a Trie word by word against loading a frozen snapshot.
+    """
+    words = make_words(count)
+    start = time.perf_counter()
+    trie = _build(Trie, words)
+    build = time.perf_counter() - start
+
+    fd, path = tempfile.mkstemp(suffix=".trie")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        trie.freeze().save(path)
+        freeze = time.perf_counter() - start
+
+        start = time.perf_counter()
+        frozen = FrozenTrie.load(path)
+        load = time.perf_counter() - start
+
+        prefixes = [word[: random.randrange(1, len(word) + 1)] for word in words]
+        prefixes = random.sample(prefixes, lookups)
+        timings = []
+        for searcher in (trie, frozen):
+            start = time.perf_counter()
+            for prefix in prefixes:
+                searcher.find(prefix).suffixes(limit=10)
+            timings.append((time.perf_counter() - start) / lookups * 1e6)
+
+        size = os.path.getsize(path) / 2**20
+        print(f"Startup for {count:,} words ({size:.1f} MiB snapshot)")
+        print(f"  insert every word             {build * 1000:9.1f} ms")
+        print(f"  freeze and save               {freeze * 1000:9.1f} ms")
+        print(f"  load (mmap)                   {load * 1000:9.3f} ms")
+        print(f"  find + 10 completions, Trie   {timings[0]:9.1f} us")
+        print(f"  find + 10 completions, frozen {timings[1]:9.1f} us")
+        frozen.close()
+    finally:
+        os.remove(path)
+
+
+def _count_nodes(root):
+    """
+    Number of distinct nodes reachable from root, counting shared ones once.
+    """
+    seen = {id(root)}
+    stack = [root]
+    while stack:
+        for child in stack.pop().children.values():
+            if id(child) not in seen:
+                seen.add(id(child))
+                stack.append(child)
+    return len(seen)
+
+
+def bench_from_sorted(count=1_000_000):
+    """
+    Compare build time and node count of Trie.insert against Trie.from_sorted.
+    """
+    words = make_words(count)
+    print(f"Building from {count:,} sorted words")
+    print(f"  {'builder':<12} {'build ms':>9} {'nodes':>11}")
+    for name, build in (
+        ("insert", lambda: _build(Trie, words)),
+        ("from_sorted", lambda: Trie.from_sorted(words)),
+    ):
+        start = time.perf_counter()
+        trie = build()
+        took = time.perf_counter() - start
+        print(f"  {name:<12} {took * 1000:>9.0f} {_count_nodes(trie.root):>11,}")
+        del trie
+
+
+def _mistype(word, rng):
+    """
+    Apply one random substitution, deletion or insertion to word.
+    """
+    i = rng.randrange(len(word))
+    char = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    edit = rng.randrange(3)
+    if edit == 0:
+        return word[:i] + char + word[i + 1 :]
+    if edit == 1:
+        return word[:i] + word[i + 1 :]
+    return word[:i] + char + word[i:]
+
+
+def bench_fuzzy(count=1_000_000, queries=200, prefix_lengths=(3, 5, 8)):
+    """
+    Report per-keystroke latency of find_fuzzy and complete_fuzzy.
+
+    The trie is built with from_sorted to keep memory down; fuzzy search walks
+    it exactly as it would the unminimized Trie.
+    """
+    rng = random.Random(2)
+    words = make_words(count)
+    trie = Trie.from_sorted(words)
+    print(f"Fuzzy prefix search on {count:,} words, {queries} mistyped prefixes")
+    print(
+        f"  {'length':>6} {'edits':>5} {'find ms':>8} "
+        f"{'first 10 ms':>12} {'matches':>8}"
+    )
+    for length in prefix_lengths:
+        candidates = [word for word in words if len(word) >= length]
+        prefixes = [
+            _mistype(rng.choice(candidates)[:length], rng) for _ in range(queries)
+        ]
+        for max_edits in (1, 2):
+            matches = 0
+            start = time.perf_counter()
+            for prefix in prefixes:
+                matches += len(trie.find_fuzzy(prefix, max_edits))
+            find = (time.perf_counter() - start) / queries * 1000
+            start = time.perf_counter()
+            for prefix in prefixes:
+                trie.complete_fuzzy(prefix, max_edits, limit=10)
+            complete = (time.perf_counter() - start) / queries * 1000
+            print(
+                f"  {length:>6} {max_edits:>5} {find:>8.2f} {complete:>12.2f} "
+                f"{matches / queries:>8.1f}"
+            )
+
+
+class _LockedTrie:
+    """
+    A plain Trie behind one lock, taken by readers and writers alike.
+    """
+
+    def __init__(self):
+        self.trie = Trie()
+        self.lock = threading.Lock()
+
+    def insert_many(self, words):
+        with self.lock:
+            for word in words:
+                self.trie.insert(word)
+
+    def complete(self, prefix):
+        with self.lock:
+            node = self.trie.find(prefix)
+            return node.suffixes(limit=10) if node else []
+
+
+class _LockFreeTrie:
+    """
+    A ConcurrentTrie, whose readers take no lock.
+    """
+
+    def __init__(self):
+        self.trie = ConcurrentTrie()
+
+    def insert_many(self, words):
+        self.trie.insert_many(words)
+
+    def complete(self, prefix):
+        node = self.trie.find(prefix)
+        return node.suffixes(limit=10) if node else []
+
+
+def bench_concurrent(count=100_000, readers=(1, 4, 8), batch=100, seconds=2.0):
+    """
+    Report read and write throughput with a background writer.
+
+    One writer adds words in batches while the reader threads complete
+    random prefixes, for a fixed time, against a locked Trie and a ConcurrentTrie.
+    The writer stops early once all count // 2 extra words are added.
+    """
+    words = make_words(count)
+    initial, extra = words[::2], words[1::2]
+    prefixes = [word[:3] for word in random.sample(words, 1000)]
+    print(f"Readers vs a batch writer over {seconds:.0f} s, {len(initial):,} words")
+    print(f"  {'trie':<14} {'readers':>7} {'reads/s':>10} {'words added/s':>14}")
+    for name, make in (
+        ("locked Trie", _LockedTrie),
+        ("ConcurrentTrie", _LockFreeTrie),
+    ):
+        for reader_count in readers:
+            trie = make()
+            trie.insert_many(initial)
+            stop = threading.Event()
+
+            def read():
+                reads = 0
+                while not stop.is_set():
+                    trie.complete(prefixes[reads % len(prefixes)])
+                    reads += 1
+                return reads
+
+            def write():
+                added = 0
+                while not stop.is_set() and added < len(extra):
+                    trie.insert_many(extra[added : added + batch])
+                    added += batch
+                return added
+
+            with ThreadPoolExecutor(reader_count + 1) as executor:
+                futures = [executor.submit(read) for _ in range(reader_count)]
+                writer = executor.submit(write)
+                time.sleep(seconds)
+                stop.set()
+                reads = sum(future.result() for future in futures)
+                added = writer.result()
+            print(
+                f"  {name:<14} {reader_count:>7} {reads / seconds:>10,.0f} "
+                f"{added / seconds:>14,.0f}"
+            )
+
+
+def main():
+    bench_memory()
+    bench_completions()
+    bench_frozen()
+    bench_from_sorted()
+    bench_fuzzy()
+    bench_concurrent()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmarks for problem_6 (min and max of unsorted integers).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_6
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from array import array
+from collections import deque
+
+from src.problem_6 import (
+    MinMaxWindow,
+    get_min_max,
+    get_min_max_file,
+    get_min_max_parallel,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the ndarray input is skipped without it
+    np = None
+
+
+def _sliced_min_max(ints):
+    """
+    The previous get_min_max, which scans a copy made by ints[1:].
+    """
+    if not len(ints):
+        return None
+    min_val = max_val = ints[0]
+    for num in ints[1:]:
+        if num < min_val:
+            min_val = num
+        elif num > max_val:
+            max_val = num
+    return (min_val, max_val)
+
+
+def _run(func, make_input):
+    """
+    Return the time and the tracemalloc peak of func on a fresh input.
+    """
+    ints = make_input()
+    start = time.perf_counter()
+    func(ints)
+    took = time.perf_counter() - start
+
+    ints = make_input()
+    tracemalloc.start()
+    func(ints)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return took, peak
+
+
+def bench_get_min_max(size=10_000_000):
+    """
+    Compare the slicing get_min_max against the current one by input type.
+    """
+    values = [random.randrange(-(2**40), 2**40) for _ in range(size)]
+    inputs = {
+        "list": lambda: values,
+        "array('q')": lambda: array("q", values),
+        "bytes": lambda: bytes(v % 256 for v in values),
+        "generator": lambda: (v for v in values),
+    }
+    if np is not None:
+        inputs["ndarray"] = lambda: np.array(values, dtype=np.int64)
+
+    print(f"get_min_max on {size:,} integers")
+    print(
+        f"  {'input':<11} {'old ms':>8} {'old peak MiB':>13} "
+        f"{'new ms':>8} {'new peak MiB':>13}"
+    )
+    for name, make_input in inputs.items():
+        row = []
+        for func in (_sliced_min_max, get_min_max):
+            if name == "generator" and func is _sliced_min_max:
+                row += ["n/a", "n/a"]  # generators cannot be sliced
+                continue
+            took, peak = _run(func, make_input)
+            row += [f"{took * 1000:.1f}", f"{peak / 2**20:.1f}"]
+        print(f"  {name:<11} {row[0]:>8} {row[1]:>13} {row[2]:>8} {row[3]:>13}")
+
+
+def _ticks_per_second(tick, values):
+    start = time.perf_counter()
+    for value in values:
+        tick(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def bench_window(sizes=(10, 100, 10**4, 10**6), ticks=20_000):
+    """
+    Compare re-scanning the window on every tick against MinMaxWindow.
+
+    The window is filled before timing, so every timed tick sees a full window.
+    The re-scan is timed on fewer ticks as the window grows.
+    """
+    print("Sliding-window min/max, ticks per second")
+    print(f"  {'window':>9} {'re-scan':>11} {'MinMaxWindow':>13}")
+    for size in sizes:
+        fill = [random.random() for _ in range(size)]
+        values = [random.random() for _ in range(ticks)]
+
+        window = deque(fill, maxlen=size)
+
+        def rescan(value):
+            window.append(value)
+            get_min_max(window)
+
+        tracker = MinMaxWindow(size)
+        for value in fill:
+            tracker.push(value)
+
+        def track(value):
+            tracker.push(value)
+            tracker.get_min_max()
+
+        rescan_ticks = values[: max(10, ticks * 100 // size)]
+        print(
+            f"  {size:>9,} {_ticks_per_second(rescan, rescan_ticks):>11,.0f} "
+            f"{_ticks_per_second(track, values):>13,.0f}"
+        )
+
+
+def bench_parallel(size=25_000_000, max_workers=None):
+    """
+    Report GB/s of get_min_max_file and get_min_max_parallel by worker count.
+
+    Without NumPy the per-chunk kernel is a pure Python scan, so expect low
+    throughput and, for the threaded version, no gain from more workers.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    values = array("q", (random.randrange(-(2**62), 2**62) for _ in range(size)))
+    gigabytes = size * values.itemsize / 1e9
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            values.tofile(f)
+        print(f"min/max of {gigabytes:.2f} GB of int64 on {os.cpu_count()} CPUs")
+        print(f"  {'workers':>7} {'file GB/s':>10} {'buffer GB/s':>12}")
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            get_min_max_file(path, "q", workers)
+            from_file = gigabytes / (time.perf_counter() - start)
+            start = time.perf_counter()
+            get_min_max_parallel(values, workers)
+            from_buffer = gigabytes / (time.perf_counter() - start)
+            print(f"  {workers:>7} {from_file:>10.3f} {from_buffer:>12.3f}")
+            workers *= 2
+    finally:
+        os.remove(path)
+
+
+def main():
+    bench_get_min_max()
+    bench_window()
+    bench_parallel()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmarks for problem_7 (HTTP router).
+
+Run from the repository root with:
+    python -m benchmarks.bench_problem_7
+"""
+import random
+import string
+import time
+
+from src.problem_7 import Router
+
+
+def _random_path(depth):
+    return "/" + "/".join(
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 8)))
+        for _ in range(depth)
+    )
+
+
+def _lookups_per_second(lookup, paths):
+    start = time.perf_counter()
+    for path in paths:
+        lookup(path)
+    return len(paths) / (time.perf_counter() - start)
+
+
+def bench_static_routes(routes=10_000, lookups=200_000):
+    """
+    Compare walking the RouteTrie against the static route table.
+
+    The trie walk is what Router.lookup did before the table was added. A
+    third of the lookups have a trailing slash and a sixth miss.
+    """
+    router = Router("root handler", "not found handler")
+    paths = [_random_path(random.randint(1, 6)) for _ in range(routes)]
+    for path in paths:
+        router.add_handler(path, path)
+
+    trace = []
+    for i in range(lookups):
+        path = random.choice(paths)
+        if i % 3 == 0:
+            path += "/"
+        elif i % 6 == 1:
+            path += "/missing"
+        trace.append(path)
+
+    def trie_lookup(path):
+        if path == "/":
+            return router.route_trie.root.handler
+        handler = router.route_trie.find(path)
+        if handler is None:
+            return router.not_found_handler
+        return handler
+
+    print(f"Router lookups per second, {routes:,} static routes")
+    print(f"  {'trie walk':<13} {_lookups_per_second(trie_lookup, trace):>12,.0f}")
+    print(f"  {'static table':<13} {_lookups_per_second(router.lookup, trace):>12,.0f}")
+
+
+def bench_mixed_routes(resources=12_500, lookups=200_000):
+    """
+    Lookups per second by route kind on a mixed route set.
+
+    Each resource gets a static list route, a ":id" route, a nested ":id"
+    route and a "*path" catch-all, so 12,500 resources make 50k routes.
+    """
+    router = Router("root handler", "not found handler")
+    names = [f"{_random_path(1)[1:]}{n}" for n in range(resources)]
+    for name in names:
+        router.add_handler(f"/{name}/items", "list")
+        router.add_handler(f"/{name}/items/:id", "item")
+        router.add_handler(f"/{name}/items/:id/orders/:order", "order")
+        router.add_handler(f"/{name}/files/*path", "file")
+
+    traces = {
+        "static": lambda name: f"/{name}/items",
+        "param": lambda name: f"/{name}/items/{random.randrange(10**6)}",
+        "2 params": lambda name: f"/{name}/items/42/orders/{random.randrange(99)}",
+        "wildcard": lambda name: f"/{name}/files/css/site{random.randrange(99)}.css",
+        "miss": lambda name: f"/{name}/missing/{random.randrange(99)}",
+    }
+    print(f"Router.match per second, {4 * resources:,} mixed routes")
+    for kind, make_path in traces.items():
+        trace = [make_path(random.choice(names)) for _ in range(lookups)]
+        print(f"  {kind:<13} {_lookups_per_second(router.match, trace):>12,.0f}")
+
+
+def bench_zipf_cache(
+    resources=12_500, distinct_paths=100_000, lookups=500_000, sizes=(1_000, 10_000)
+):
+    """
+    Replay a Zipf-distributed trace against uncached and cached routers.
+
+    The trace draws from distinct_paths paths with weight 1 / rank, so the
+    most popular 1% of paths take roughly 60% of lookups. A tenth of the
+    paths match no route.
+    """
+    names = [f"{_random_path(1)[1:]}{n}" for n in range(resources)]
+    routes = []
+    for name in names:
+        routes += [
+            (f"/{name}/items", "list"),
+            (f"/{name}/items/:id", "item"),
+            (f"/{name}/files/*path", "file"),
+        ]
+    paths = []
+    for n in range(distinct_paths):
+        name = random.choice(names)
+        kind = n % 10
+        if kind < 3:
+            paths.append(f"/{name}/items")
+        elif kind < 7:
+            paths.append(f"/{name}/items/{n}")
+        elif kind < 9:
+            paths.append(f"/{name}/files/img/{n}.png")
+        else:
+            paths.append(f"/{name}/missing/{n}")
+    weights = [1 / rank for rank in range(1, distinct_paths + 1)]
+    trace = random.choices(paths, weights, k=lookups)
+
+    print(f"Zipf trace of {lookups:,} lookups over {distinct_paths:,} paths")
+    print(f"  {'cache size':>10} {'lookups/s':>12} {'hit rate':>9} {'evictions':>10}")
+    for cache_size in (0, *sizes):
+        router = Router("root handler", "not found handler", cache_size=cache_size)
+        for path, handler in routes:
+            router.add_handler(path, handler)
+        rate = _lookups_per_second(router.lookup, trace)
+        hit_rate = f"{router.hits / lookups:.1%}" if cache_size else "n/a"
+        print(
+            f"  {cache_size:>10,} {rate:>12,.0f} {hit_rate:>9} "
+            f"{router.evictions:>10,}"
+        )
+
+
+def main():
+    bench_static_routes()
+    bench_mixed_routes()
+    bench_zipf_cache()
+
+
+if __name__ == "__main__":
+    main()
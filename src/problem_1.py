@@ -1,3 +1,9 @@
+import math
+import sys
+from array import array
+from collections import OrderedDict
+
+
 def sqrt(number: int) -> int:
     """
     Calculate the floored square root of a number
@@ -26,8 +32,223 @@ def sqrt(number: int) -> int:
     return x
 
 
-print("Pass" if (3 == sqrt(9)) else "Fail")
-print("Pass" if (0 == sqrt(0)) else "Fail")
-print("Pass" if (4 == sqrt(16)) else "Fail")
-print("Pass" if (1 == sqrt(1)) else "Fail")
-print("Pass" if (5 == sqrt(27)) else "Fail")
+def _recursive_sqrt(number: int) -> int:
+    """
+    Pure Python port of the recursive integer square root behind math.isqrt.
+
+    Each step doubles the number of correct leading bits of the root, working
+    on a shifted-down copy of the input, so a b-bit number takes about
+    log2(b) steps instead of the O(b) halvings Newton-Raphson needs when it
+    starts at x = number.
+    """
+    c = (number.bit_length() - 1) // 2
+    a = 1
+    d = 0
+    for s in reversed(range(c.bit_length())):
+        e = d
+        d = c >> s
+        a = (a << d - e - 1) + (number >> 2 * c - e - d + 1) // a
+    return a - (a * a > number)
+
+
+# math.isqrt is only available from Python 3.8
+_isqrt = getattr(math, "isqrt", _recursive_sqrt)
+
+
+def sqrt_big(number: int) -> int:
+    """
+    Calculate the floored square root of a number of any size
+
+    Args:
+       number(int): Number to find the floored squared root
+    Returns:
+       int: Floored Square Root
+
+    Same result as sqrt, but dispatches to math.isqrt when it is available and
+    to a recursive, precision-doubling square root otherwise.
+
+    Time complexity:
+        O(log b) steps for a b-bit number
+    """
+    if number < 0:
+        raise ValueError("Cannot compute square root of negative number")
+    if number == 0 or number == 1:
+        return number
+    return _isqrt(number)
+
+
+class SqrtCache:
+    """
+    Memoising wrapper around sqrt_big for workloads that repeat inputs.
+
+    Inputs below table_bound are answered from a precomputed table of floored
+    roots, so a small-input call is a single list index. Larger inputs go
+    through a bounded LRU cache.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the LRU cache.
+        table_bound (int): Inputs below this are served from the table.
+        hits (int): Number of calls answered from the LRU cache.
+        misses (int): Number of calls that had to compute the root.
+    """
+
+    def __init__(self, maxsize: int = 1024, table_bound: int = 2**20):
+        """
+        Initialise the cache and build the lookup table.
+
+        Time complexity: O(table_bound)
+        """
+        if maxsize < 0 or table_bound < 0:
+            raise ValueError("maxsize and table_bound must not be negative")
+        self.maxsize = maxsize
+        self.table_bound = table_bound
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        # Every root r covers the 2r + 1 numbers from r**2 to (r + 1)**2 - 1
+        table = []
+        root = 0
+        while len(table) < table_bound:
+            table.extend([root] * (2 * root + 1))
+            root += 1
+        del table[table_bound:]
+        self._table = table
+
+    def __call__(self, number: int) -> int:
+        """
+        Return the floored square root of number.
+
+        Time complexity: O(1) for cached or tabled inputs
+        """
+        if 0 <= number < self.table_bound:
+            return self._table[number]
+
+        cache = self._cache
+        if number in cache:
+            cache.move_to_end(number)
+            self.hits += 1
+            return cache[number]
+
+        root = sqrt_big(number)
+        self.misses += 1
+        if self.maxsize:
+            cache[number] = root
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return root
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """
+        Empty the LRU cache and reset the hit/miss counters.
+
+        The lookup table is left in place.
+        """
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Values below this fit in a signed 64-bit integer and a float64 square root
+# lands within one of the true floored root
+INT64_LIMIT = 2**63
+
+
+def _float_sqrt(number: int) -> int:
+    """
+    Floored square root of a 64-bit integer using a float estimate.
+
+    math.sqrt is accurate to within one for every value below INT64_LIMIT,
+    so we only need to nudge the estimate down or up once.
+    """
+    root = int(math.sqrt(number))
+    if root * root > number:
+        root -= 1
+    elif (root + 1) * (root + 1) <= number:
+        root += 1
+    return root
+
+
+def _sqrt_many_numpy(values) -> "np.ndarray":
+    """
+    Vectorised floored square root of an int64 NumPy array.
+
+    Takes the float64 square root of the whole array and then corrects the
+    off-by-one results in unsigned 64-bit so (root + 1) ** 2 cannot overflow.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.int64)
+    if values.size and values.min() < 0:
+        raise ValueError("Cannot compute square root of negative number")
+
+    unsigned = values.astype(np.uint64)
+    roots = np.sqrt(values.astype(np.float64)).astype(np.uint64)
+    too_big = roots * roots > unsigned
+    roots[too_big] -= 1
+    too_small = (roots + 1) * (roots + 1) <= unsigned
+    roots[too_small] += 1
+    return roots.astype(np.int64)
+
+
+def sqrt_many(values) -> list:
+    """
+    Calculate the floored square root of every number in a batch
+
+    Args:
+       values(list, array or numpy.ndarray): Numbers to find the floored root of
+    Returns:
+       list: Floored square roots in the same order, or a numpy.ndarray when
+             given an ndarray
+
+    64-bit values go through a float square root followed by a one-step
+    correction; only big ints fall back to sqrt_big.
+    The results match sqrt exactly, including the ValueError on negative input.
+    Integer arrays that cannot be cast to int64 without wrapping, such as
+    uint64 or object arrays, are handled one value at a time.
+
+    Raises:
+        TypeError: If given an ndarray that does not hold integers.
+
+    Time complexity:
+        O(n) for n 64-bit values, plus O(log m) per big int m
+    """
+    # numpy is only imported when needed; an ndarray means it is already loaded
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(values, np.ndarray):
+        if np.can_cast(values.dtype, np.int64):
+            return _sqrt_many_numpy(values)
+        if values.dtype.kind not in "uO":
+            raise TypeError(f"Cannot compute square root of {values.dtype} values")
+        return np.array(sqrt_many(values.tolist()))
+    if isinstance(values, array) and values.typecode == "q":
+        try:
+            import numpy as np
+        except ImportError:  # numpy is optional, fall back to the Python loop
+            np = None
+        if np is not None:
+            return _sqrt_many_numpy(np.frombuffer(values, dtype=np.int64)).tolist()
+
+    roots = []
+    for number in values:
+        if number < 0:
+            raise ValueError("Cannot compute square root of negative number")
+        if number < INT64_LIMIT:
+            roots.append(_float_sqrt(number))
+        else:
+            roots.append(sqrt_big(number))
+    return roots
+
+
+def main():
+    print("Pass" if (3 == sqrt(9)) else "Fail")
+    print("Pass" if (0 == sqrt(0)) else "Fail")
+    print("Pass" if (4 == sqrt(16)) else "Fail")
+    print("Pass" if (1 == sqrt(1)) else "Fail")
+    print("Pass" if (5 == sqrt(27)) else "Fail")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,10 @@
+import argparse
+import mmap
+import os
+import sys
+from bisect import bisect_left
+
+
 def rotated_array_search(input_list: list, number: int) -> int:
     """
     Find the index by searching in a rotated sorted array
@@ -14,7 +21,7 @@ def rotated_array_search(input_list: list, number: int) -> int:
     while left <= right:
         mid = (left + right) // 2
         if input_list[mid] == number:
-            return input_list[mid]
+            return mid
 
         # Check if the left half is sorted
         if input_list[left] <= input_list[mid]:
@@ -32,6 +39,219 @@ def rotated_array_search(input_list: list, number: int) -> int:
     return -1
 
 
+def find_pivot(input_list: list) -> int:
+    """
+    Find where the rotation starts in a rotated sorted array
+
+    Args:
+       input_list(array): Rotated sorted array, duplicates allowed
+    Returns:
+       int: Index of the first element of the second sorted run, 0 if the
+            array is not rotated
+
+    When the middle and right elements are equal we cannot tell which side the
+    pivot is on, so we only drop the right element, after checking it is not
+    the pivot itself.
+
+    Time complexity:
+        O(log n) with few duplicates, degrading towards O(n) as the
+        duplicates of the end values take over
+    """
+    left, right = 0, len(input_list) - 1
+    while left < right:
+        mid = (left + right) // 2
+        if input_list[mid] > input_list[right]:
+            left = mid + 1
+        elif input_list[mid] < input_list[right]:
+            right = mid
+        else:
+            if input_list[right - 1] > input_list[right]:
+                return right
+            right -= 1
+    return left
+
+
+def rotated_array_search_first(input_list: list, number: int) -> int:
+    """
+    Find the index of the first occurrence of number in a rotated sorted array
+
+    Unlike rotated_array_search this is safe with duplicate keys such as
+    [2, 2, 2, 3, 1, 2, 2], where comparing the left and middle elements
+    cannot tell which half is sorted.
+
+    Args:
+       input_list(array), number(int): Input array to search and the target
+    Returns:
+       int: Index or -1
+
+    Time complexity: that of find_pivot plus O(log n) for the bisect
+    """
+    return RotatedSortedIndex(input_list).search(number)
+
+
+class RotatedSortedIndex:
+    """
+    Answers repeated searches on the same rotated sorted array.
+
+    The rotation point is found once when the index is built, after which
+    each lookup is a single bisect on whichever sorted half can hold the
+    target. Duplicates are allowed and the first occurrence is returned.
+
+    Any indexable sequence works, including a memoryview cast to a fixed-width
+    integer format, in which case elements are only read as they are compared.
+
+    Attributes:
+        input_list (list): The rotated sorted array being searched.
+        pivot (int): Index where the second sorted run starts, 0 if unrotated.
+    """
+
+    def __init__(self, input_list: list):
+        """
+        Build the index by locating the pivot.
+
+        Time complexity: O(log n), see find_pivot for duplicate-heavy input
+        """
+        self.input_list = input_list
+        self.pivot = find_pivot(input_list)
+
+    def _half(self, number: int) -> tuple:
+        """
+        Return the (lo, hi) bounds of the sorted half that could hold number.
+        """
+        if self.pivot and number >= self.input_list[0]:
+            return 0, self.pivot
+        return self.pivot, len(self.input_list)
+
+    def search(self, number: int) -> int:
+        """
+        Find the index of number
+
+        Args:
+           number(int): Target to look for
+        Returns:
+           int: Index or -1
+
+        Time complexity: O(log n)
+        """
+        lo, hi = self._half(number)
+        index = bisect_left(self.input_list, number, lo, hi)
+        if index < hi and self.input_list[index] == number:
+            return index
+        return -1
+
+    def search_many(self, targets: list) -> list:
+        """
+        Find the index of every target
+
+        Args:
+           targets(list): Targets to look for
+        Returns:
+           list: Index or -1 for each target, in the same order
+
+        Sorted batches are answered with a merge-style sweep: each bisect
+        starts where the previous target landed in the same half, so the
+        search window only ever shrinks.
+
+        Time complexity: O(m log n) for m targets
+        """
+        if any(targets[i] > targets[i + 1] for i in range(len(targets) - 1)):
+            return [self.search(number) for number in targets]
+
+        input_list = self.input_list
+        results = []
+        # Targets below input_list[0] live in the right half and sort first
+        floor, half_end = 0, None
+        for number in targets:
+            lo, hi = self._half(number)
+            if hi != half_end:
+                floor, half_end = lo, hi
+            index = bisect_left(input_list, number, floor, hi)
+            floor = index
+            if index < hi and input_list[index] == number:
+                results.append(index)
+            else:
+                results.append(-1)
+        return results
+
+
+def int_view(buffer, typecode: str = "q") -> memoryview:
+    """
+    Return a zero-copy memoryview of buffer as fixed-width integers
+
+    Args:
+       buffer: bytes, bytearray, array, mmap or anything with the buffer protocol
+       typecode(str): struct format of one element, "q" for native int64
+    Returns:
+       memoryview: Indexable view yielding ints, without copying the data
+    """
+    view = memoryview(buffer)
+    if view.format != typecode:
+        view = view.cast("B").cast(typecode)
+    return view
+
+
+class RotatedSortedFile:
+    """
+    Searches a rotated sorted binary file of fixed-width integers in place.
+
+    The file is memory-mapped read-only and searched through int_view, so it is
+    never loaded into Python objects; a lookup only touches the pages its
+    bisect reads. Values are in native byte order.
+
+    Use as a context manager, or call close() when done.
+
+    Attributes:
+        index (RotatedSortedIndex): Index over the mapped integers.
+    """
+
+    def __init__(self, path: str, typecode: str = "q"):
+        """
+        Map the file and locate its pivot.
+
+        Raises:
+            ValueError: If the file size is not a multiple of the item size.
+
+        Time complexity: O(log n)
+        """
+        view = memoryview(b"").cast(typecode)
+        # Checked before opening, so a bad file leaves nothing to close
+        if os.path.getsize(path) % view.itemsize:
+            raise ValueError(f"File size is not a multiple of {view.itemsize} bytes")
+        self._file = open(path, "rb")
+        self._mmap = None
+        # mmap refuses empty files, which we treat as an empty array
+        if self._file.seek(0, 2):
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = int_view(self._mmap, typecode)
+        self._view = view
+        self.index = RotatedSortedIndex(view)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def search(self, number: int) -> int:
+        return self.index.search(number)
+
+    def search_many(self, targets: list) -> list:
+        return self.index.search_many(targets)
+
+    def close(self) -> None:
+        """
+        Release the view and unmap the file.
+        """
+        self.index = None
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "RotatedSortedFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def linear_search(input_list, number):
     for index, element in enumerate(input_list):
         if element == number:
@@ -48,8 +268,43 @@ def test_function(test_case):
         print("Fail")
 
 
-test_function([[6, 7, 8, 9, 10, 1, 2, 3, 4], 6])
-test_function([[6, 7, 8, 9, 10, 1, 2, 3, 4], 1])
-test_function([[6, 7, 8, 1, 2, 3, 4], 8])
-test_function([[6, 7, 8, 1, 2, 3, 4], 1])
-test_function([[6, 7, 8, 1, 2, 3, 4], 10])
+def main():
+    test_function([[6, 7, 8, 9, 10, 1, 2, 3, 4], 6])
+    test_function([[6, 7, 8, 9, 10, 1, 2, 3, 4], 1])
+    test_function([[6, 7, 8, 1, 2, 3, 4], 8])
+    test_function([[6, 7, 8, 1, 2, 3, 4], 1])
+    test_function([[6, 7, 8, 1, 2, 3, 4], 10])
+
+
+def search_file_main(argv=None):
+    """
+    Command line entry point answering lookups on a rotated sorted int file.
+
+    Prints the index of each target, or -1, one per line. Targets come from
+    the command line, or from stdin one per line when none are given.
+    """
+    parser = argparse.ArgumentParser(
+        description="Search a rotated sorted binary file of fixed-width integers"
+    )
+    parser.add_argument("path", help="file of native byte order integers")
+    parser.add_argument("targets", nargs="*", type=int, help="values to look up")
+    parser.add_argument(
+        "--typecode", default="q", help='struct format of one element (default "q")'
+    )
+    args = parser.parse_args(argv)
+
+    with RotatedSortedFile(args.path, args.typecode) as rotated_file:
+        if args.targets:
+            for index in rotated_file.search_many(args.targets):
+                print(index)
+        else:
+            for line in sys.stdin:
+                if line.strip():
+                    print(rotated_file.search(int(line)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        search_file_main()
+    else:
+        main()
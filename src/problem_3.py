@@ -1,41 +1,250 @@
-def rearrange_digits(input_list):
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _count_values(input_list, base: int = 10) -> list:
+    """
+    Count how many times each digit appears, validating as we go.
+
+    Raises:
+        ValueError: If a value is not a digit in the given base.
+    """
+    count = [0] * base
+    for num in input_list:
+        # Negative values would otherwise silently count from the end
+        if not 0 <= num < base:
+            raise ValueError(f"{num!r} is not a digit in base {base}")
+        count[num] += 1
+    return count
+
+
+def _deal(count, k: int = 2) -> list:
     """
-    Rearrange Array Elements so as to form two number such that their sum is maximum.
+    Deal the counted digits, largest first, round-robin to k numbers.
+
+    Returns:
+        list: For each number, its (digit, run length) runs, most significant
+              first
+    """
+    runs = [[] for _ in range(k)]
+    position = 0  # digits dealt so far, position p goes to number p % k
+    for digit in range(len(count) - 1, -1, -1):
+        end = position + count[digit]
+        for j in range(k):
+            # Positions in [position, end) congruent to j modulo k
+            length = (end - j + k - 1) // k - (position - j + k - 1) // k
+            if length:
+                runs[j].append((digit, length))
+        position = end
+    return runs
+
+
+def rearrange_digits(input_list, base: int = 10, k: int = 2) -> list:
+    """
+    Rearrange Array Elements so as to form k numbers such that their sum is maximum.
 
     Args:
-       input_list(list): Input List
+       input_list(list): Input List of digits
+       base(int): Base the digits and the resulting numbers are in
+       k(int): How many numbers to form
     Returns:
-       (int),(int): Two maximum sums
+       list: The k numbers, largest first
 
     This algorithm uses the Counting sort algorithm to count occurences of digits
-    and help sort th input array
+    and help sort th input array. The sorted digits are then dealt round-robin
+    to the k numbers, so each number gets the largest digits left.
+
+    A run of c copies of digit d is appended in one step, as
+    num * base**c + d * (base**c - 1) // (base - 1), so at most base big-int
+    operations are needed per number instead of one per digit.
+
+    Raises:
+        ValueError: If base < 2, k < 1 or a value is not a digit in base.
 
     Time complexity:
-        O(n) where n is the length of count no more than 10
+        O(n + k * base) where n is the length of the input
+    """
+    if base < 2 or k < 1:
+        raise ValueError("base must be at least 2 and k at least 1")
+
+    # Create a list of base items to count how many times each digit appears
+    count = _count_values(input_list, base)
+
+    numbers = []
+    for runs in _deal(count, k):
+        num = 0
+        for digit, length in runs:
+            shift = base**length
+            num = num * shift + digit * (shift - 1) // (base - 1)
+        numbers.append(num)
+    return numbers
+
+
+DIGITS = "0123456789"
+ASCII_DIGITS = DIGITS.encode()
+# ASCII whitespace is skipped when counting a byte stream, e.g. a trailing newline
+WHITESPACE = b" \t\r\n"
+CHUNK_SIZE = 1 << 20
+
+
+def _count_bytes(chunk, count):
+    """
+    Add the ASCII digits of a bytes-like chunk to count, using bytes.count.
+    """
+    counted = 0
+    for i in range(10):
+        found = chunk.count(ASCII_DIGITS[i : i + 1])
+        count[i] += found
+        counted += found
+    for i in range(len(WHITESPACE)):
+        counted += chunk.count(WHITESPACE[i : i + 1])
+    if counted != len(chunk):
+        raise ValueError("Byte stream contains characters other than digits")
+
+
+def count_digits(digits) -> list:
+    """
+    Count how many times each digit appears.
+
+    Args:
+       digits: Iterable of ints 0-9, a bytes-like object of ASCII digits or a
+               binary file object to read ASCII digits from
+    Returns:
+       list: Ten counts, indexed by digit
+
+    Bytes are counted with bytes.count and files are read in chunks, so
+    neither is turned into Python ints one digit at a time.
+
+    Time complexity: O(n)
     """
-    # Create a list of 10 items all 0 to count how many times a number appears
     count = [0] * 10
-    for num in input_list:
-        count[num] += 1
+    if isinstance(digits, memoryview):
+        digits = digits.tobytes()
+    if isinstance(digits, (bytes, bytearray)):
+        _count_bytes(digits, count)
+    elif hasattr(digits, "read"):
+        for chunk in iter(lambda: digits.read(CHUNK_SIZE), b""):
+            _count_bytes(chunk, count)
+    else:
+        count = _count_values(digits)
+    return count
 
-    # Create two numbers
-    num1, num2 = 0, 0
-    toggle = 0  # 0 for num1, 1 for num2
 
-    # Iterate from 9 to 0 (largest to smallest digit)
-    for i in range(9, -1, -1):
-        while count[i] > 0:
-            if toggle == 0:
-                num1 = (
-                    num1 * 10 + i
-                )  # need mult by 10 to move prev digit to correct position
-                toggle = 1
-            else:
-                num2 = num2 * 10 + i
-                toggle = 0
-            count[i] -= 1
+def _count_chunk(chunk) -> list:
+    """
+    Count the digits of one chunk in a worker process.
+
+    Bytes chunks are counted with bytes.count and lists of ints with
+    list.count, so each digit costs a C-level comparison rather than a
+    Python loop iteration.
+    """
+    count = [0] * 10
+    if isinstance(chunk, bytes):
+        _count_bytes(chunk, count)
+        return count
+    for i in range(10):
+        count[i] = chunk.count(i)
+    if sum(count) != len(chunk):
+        raise ValueError("Input contains values other than the digits 0-9")
+    return count
+
+
+def _chunks(digits, chunk_size):
+    """
+    Split any input accepted by count_digits into picklable chunks.
+    """
+    if isinstance(digits, (bytes, bytearray, memoryview)):
+        view = memoryview(digits).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size].tobytes()
+    elif hasattr(digits, "read"):
+        yield from iter(lambda: digits.read(chunk_size), b"")
+    elif hasattr(digits, "__getitem__") and hasattr(digits, "__len__"):
+        for start in range(0, len(digits), chunk_size):
+            yield list(digits[start : start + chunk_size])
+    else:
+        iterator = iter(digits)
+        yield from iter(lambda: list(islice(iterator, chunk_size)), [])
+
+
+def count_digits_parallel(digits, workers=None, chunk_size=CHUNK_SIZE) -> list:
+    """
+    Count how many times each digit appears, using a pool of processes.
+
+    Args:
+       digits: Same inputs as count_digits
+       workers(int): Number of worker processes, defaults to the CPU count
+       chunk_size(int): Digits sent to a worker at a time
+    Returns:
+       list: Ten counts, indexed by digit
+
+    Chunks are counted in a ProcessPoolExecutor and their 10-element
+    histograms summed. At most two chunks per worker are in flight, so a
+    long file or iterator is never read into memory all at once.
+
+    Time complexity: O(n / workers) plus the cost of sending the chunks
+    """
+    workers = workers or os.cpu_count() or 1
+    count = [0] * 10
 
-    return [num1, num2]
+    def merge(future):
+        for i, found in enumerate(future.result()):
+            count[i] += found
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in _chunks(digits, chunk_size):
+            pending.append(executor.submit(_count_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                merge(pending.popleft())
+        while pending:
+            merge(pending.popleft())
+    return count
+
+
+def _assemble(count, chars):
+    """
+    Deal the counted digits, largest first, alternately to two numbers.
+
+    Each digit contributes one run to each number, so the numbers are built
+    from at most ten repeated slices of chars and joined once.
+    """
+    numbers = []
+    for runs in _deal(count, 2):
+        number = chars[:0].join(chars[i : i + 1] * length for i, length in runs)
+        # A leading zero means every digit is zero
+        if not number or number[:1] == chars[:1]:
+            number = chars[:1]
+        numbers.append(number)
+    return numbers
+
+
+def rearrange_digits_stream(digits, as_bytes: bool = False, workers=None) -> list:
+    """
+    Rearrange a stream of digits into two numbers with the maximum sum.
+
+    Args:
+       digits: Iterable of ints 0-9, a bytes-like object of ASCII digits or a
+               binary file object to read ASCII digits from
+       as_bytes(bool): Return bytes instead of str
+       workers(int): Count the digits in this many processes, see
+                     count_digits_parallel; counted serially when None
+    Returns:
+       list: The two numbers as decimal digit strings (or bytes)
+
+    Same result as rearrange_digits, but the numbers are emitted as digit
+    strings instead of being built with big-int arithmetic, which is
+    quadratic in the number of digits.
+
+    Time complexity: O(n)
+    """
+    if workers:
+        count = count_digits_parallel(digits, workers)
+    else:
+        count = count_digits(digits)
+    return _assemble(count, ASCII_DIGITS if as_bytes else DIGITS)
 
 
 def test_function(test_case):
@@ -47,5 +256,11 @@ def test_function(test_case):
         print("Fail")
 
 
-test_function([[1, 2, 3, 4, 5], [542, 31]])
-test_case = [[4, 6, 2, 5, 9, 8], [964, 852]]
+def main():
+    test_function([[1, 2, 3, 4, 5], [542, 31]])
+    test_case = [[4, 6, 2, 5, 9, 8], [964, 852]]
+    test_function(test_case)
+
+
+if __name__ == "__main__":
+    main()
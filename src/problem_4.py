@@ -1,3 +1,9 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
 def sort_012(input_list: list) -> list:
     """
     Given an input array consisting on only 0, 1, and 2, sort the array in a single traversal.
@@ -28,6 +34,255 @@ def sort_012(input_list: list) -> list:
     return input_list
 
 
+def _fill(input_list, start: int, stop: int, value: int) -> None:
+    """
+    Overwrite input_list[start:stop] with value using one slice assignment.
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(input_list, np.ndarray):
+        input_list[start:stop] = value
+        return
+    # input_list[:0] is an empty container of the same type as input_list, so
+    # this builds a list, bytearray or array('b') as needed
+    one = input_list[:0]
+    one.append(value)
+    input_list[start:stop] = one * (stop - start)
+
+
+def sort_012_counting(input_list):
+    """
+    Sort an array of 0s, 1s and 2s in place by counting them.
+
+    Args:
+       input_list: list, bytearray, array('b') or numpy array to be sorted
+    Returns:
+       The same input_list, sorted
+
+    Instead of swapping one element at a time we count the 0s, 1s and 2s with
+    the container's C-level count and then rewrite the three regions with
+    slice assignments.
+
+    Raises:
+        ValueError: If input_list contains anything other than 0, 1 and 2.
+
+    Time coplexity:
+        O(n) where n is the length of the input array
+    """
+    # numpy is never imported here; an ndarray means it is already loaded
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(input_list, np.ndarray):
+        counts = np.bincount(input_list, minlength=3)
+        zeros, ones = int(counts[0]), int(counts[1])
+        valid = len(counts) == 3
+    else:
+        zeros, ones = input_list.count(0), input_list.count(1)
+        valid = zeros + ones + input_list.count(2) == len(input_list)
+    if not valid:
+        raise ValueError("Input must contain only 0, 1 and 2")
+
+    _fill(input_list, 0, zeros, 0)
+    _fill(input_list, zeros, zeros + ones, 1)
+    _fill(input_list, zeros + ones, len(input_list), 2)
+    return input_list
+
+
+def _count_shared(name: str, start: int, stop: int) -> tuple:
+    """
+    Count the 0s, 1s and 2s of one chunk of a shared memory block.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        chunk = shm.buf[start:stop].tobytes()
+    finally:
+        shm.close()
+    return chunk.count(0), chunk.count(1), chunk.count(2)
+
+
+def _fill_shared(name: str, start: int, stop: int, zeros: int, ones: int) -> None:
+    """
+    Write the sorted values into one chunk of a shared memory block.
+
+    The first zeros positions of the whole block hold 0, the next ones
+    positions hold 1 and the rest hold 2; we only write the part of that
+    layout which falls inside [start, stop).
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        regions = ((0, 0, zeros), (1, zeros, zeros + ones), (2, zeros + ones, stop))
+        for value, low, high in regions:
+            low, high = max(low, start), min(high, stop)
+            if low < high:
+                shm.buf[low:high] = bytes([value]) * (high - low)
+    finally:
+        shm.close()
+
+
+def sort_012_parallel(input_list, workers=None):
+    """
+    Sort an array of 0s, 1s and 2s in place using a pool of processes.
+
+    Args:
+       input_list: list, bytearray, array('b') or int8 numpy array to be sorted
+       workers(int): Number of worker processes, defaults to the CPU count
+    Returns:
+       The same input_list, sorted
+
+    The values are copied once into a multiprocessing shared memory block, one
+    byte each. Workers count the 0s, 1s and 2s of their own chunk of the
+    block, the counts are summed, and then each worker writes the sorted
+    values into its chunk. Only names and offsets are sent to the workers,
+    never the data.
+
+    Raises:
+        ValueError: If input_list contains anything other than 0, 1 and 2.
+
+    Time coplexity:
+        O(n / workers) plus two O(n) copies in and out of shared memory
+    """
+    size = len(input_list)
+    if not size:
+        return input_list
+    if isinstance(input_list, list):
+        # bytes() also rejects anything outside range(256)
+        data = bytes(input_list)
+    else:
+        data = memoryview(input_list).cast("B")
+        if len(data) != size:
+            raise TypeError("Buffers must hold one byte per element")
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = -(-size // workers)
+    bounds = [
+        (start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)
+    ]
+
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shm.buf[:size] = data
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(_count_shared, shm.name, start, stop)
+                for start, stop in bounds
+            ]
+            counts = [future.result() for future in futures]
+            zeros = sum(count[0] for count in counts)
+            ones = sum(count[1] for count in counts)
+            if zeros + ones + sum(count[2] for count in counts) != size:
+                raise ValueError("Input must contain only 0, 1 and 2")
+
+            futures = [
+                executor.submit(_fill_shared, shm.name, start, stop, zeros, ones)
+                for start, stop in bounds
+            ]
+            for future in futures:
+                future.result()
+
+        if isinstance(input_list, list):
+            input_list[:] = shm.buf[:size]
+        else:
+            data[:] = shm.buf[:size]
+    finally:
+        shm.close()
+        shm.unlink()
+    return input_list
+
+
+def _dutch_flag(items: list, key) -> list:
+    """
+    Three-way partition of items by key, with the pointers of sort_012.
+
+    Every key is checked before anything is moved, so a bad key leaves items
+    unchanged.
+    """
+    for item in items:
+        bucket = key(item)
+        if bucket not in (0, 1, 2):
+            raise ValueError(f"key {bucket!r} is not in range(3)")
+
+    low = 0
+    mid = 0
+    high = len(items) - 1
+
+    while mid <= high:
+        bucket = key(items[mid])
+        if bucket == 0:
+            items[low], items[mid] = items[mid], items[low]
+            low += 1
+            mid += 1
+        elif bucket == 1:
+            mid += 1
+        else:
+            items[high], items[mid] = items[mid], items[high]
+            high -= 1
+
+    return items
+
+
+def partition_by_key(items: list, key, k: int, stable: bool = False) -> list:
+    """
+    Partition items in place so their keys, 0 to k - 1, come out in order.
+
+    Args:
+       items(list): Records to be partitioned
+       key(callable): Returns the small integer key, in range(k), of a record
+       k(int): Number of distinct keys, up to a few hundred
+       stable(bool): Keep records with equal keys in their original order
+    Returns:
+       list: The same items, partitioned
+
+    For k == 3 this is the single-traversal pointer loop of sort_012. Otherwise
+    it is an American flag sort: count the keys, work out where each bucket
+    starts, then swap every record straight into the next free slot of its
+    bucket, using O(k) extra memory. The stable mode instead copies the records
+    to one scratch list and writes them back in bucket order.
+
+    Raises:
+        ValueError: If a key is outside range(k).
+
+    Time coplexity:
+        O(n + k) where n is the length of the input array
+    """
+    if k == 3 and not stable:
+        return _dutch_flag(items, key)
+
+    count = [0] * k
+    for item in items:
+        bucket = key(item)
+        if not 0 <= bucket < k:
+            raise ValueError(f"key {bucket!r} is not in range({k})")
+        count[bucket] += 1
+
+    # next_free[b] is where the next record with key b goes, end[b] where
+    # bucket b stops
+    next_free = [0] * k
+    end = [0] * k
+    total = 0
+    for bucket in range(k):
+        next_free[bucket] = total
+        total += count[bucket]
+        end[bucket] = total
+
+    if stable:
+        for item in list(items):
+            bucket = key(item)
+            items[next_free[bucket]] = item
+            next_free[bucket] += 1
+        return items
+
+    for bucket in range(k):
+        while next_free[bucket] < end[bucket]:
+            item = items[next_free[bucket]]
+            target = key(item)
+            if target == bucket:
+                next_free[bucket] += 1
+            else:
+                # Swap the record into its own bucket and look at what came back
+                slot = next_free[target]
+                items[next_free[bucket]], items[slot] = items[slot], item
+                next_free[target] += 1
+    return items
+
+
 def test_function(test_case):
     sorted_array = sort_012(test_case)
     print(sorted_array)
@@ -37,8 +292,13 @@ def test_function(test_case):
         print("Fail")
 
 
-test_function([0, 0, 2, 2, 2, 1, 1, 1, 2, 0, 2])
-test_function(
-    [2, 1, 2, 0, 0, 2, 1, 0, 1, 0, 0, 2, 2, 2, 1, 2, 0, 0, 0, 2, 1, 0, 2, 0, 0, 1]
-)
-test_function([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2])
+def main():
+    test_function([0, 0, 2, 2, 2, 1, 1, 1, 2, 0, 2])
+    test_function(
+        [2, 1, 2, 0, 0, 2, 1, 0, 1, 0, 0, 2, 2, 2, 1, 2, 0, 0, 0, 2, 1, 0, 2, 0, 0, 1]
+    )
+    test_function([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2])
+
+
+if __name__ == "__main__":
+    main()
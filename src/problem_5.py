@@ -1,3 +1,11 @@
+import heapq
+import mmap
+import struct
+import threading
+from array import array
+from collections import deque
+
+
 # Represents a single node in the Trie
 class TrieNode:
     """
@@ -11,12 +19,20 @@ class TrieNode:
                          and values are TrieNode objects.
         is_end_of_word (bool): Flag indicating if this node represents
                                the end of a word.
+        weight (int): Frequency of the word ending here, 0 if there is none.
+        max_weight (int): Largest word weight in the subtree below this node,
+                          used to rank completions.
+
+    Nodes use __slots__, so each one is a small fixed-size object rather than
+    an object plus an attribute dictionary.
 
     Time complexity:
         - Initialization: O(1)
         - Node insertion: O(1) average case
     """
 
+    __slots__ = ("children", "is_end_of_word", "weight", "max_weight")
+
     def __init__(self):
         """
         Initialise a new TrieNode.
@@ -27,6 +43,8 @@ class TrieNode:
         # Initialize this node in the Trie
         self.children = {}
         self.is_end_of_word = False
+        self.weight = 0
+        self.max_weight = 0
 
     def insert(self, char: str) -> "TrieNode":
         """
@@ -43,15 +61,58 @@ class TrieNode:
         """
         # Add a child node in this Trie
         if char not in self.children:
-            self.children[char] = TrieNode()
+            self.children[char] = type(self)()
         return self.children[char]
 
-    def suffixes(self, suffix=""):
+    def iter_suffixes(self, suffix="", limit=None):
         """
-        Recursive function that collects the suffix for all complete words below this point.
+        Lazily yield the suffix of every complete word below this point.
+
+        Walks the trie depth first with an explicit stack, in the same order as
+        suffixes, so long words cannot hit the recursion limit and a string is
+        only built for each complete word, not for every node visited.
+
+        Args:
+            suffix (str): Prepended to every suffix yielded (default '').
+            limit (int): Stop after this many suffixes (default no limit).
+
+        Yields:
+            str: The suffix of each complete word starting from this node.
+
+        Time complexity: O(n) for n characters in the suffixes yielded.
+        """
+        if limit is not None and limit <= 0:
+            return
+        found = 0
+        if self.is_end_of_word:
+            yield suffix
+            found += 1
+            if found == limit:
+                return
+
+        path = [suffix]
+        stack = [iter(self.children.items())]
+        while stack:
+            for char, child_node in stack[-1]:
+                path.append(char)
+                if child_node.is_end_of_word:
+                    yield "".join(path)
+                    found += 1
+                    if found == limit:
+                        return
+                stack.append(iter(child_node.children.items()))
+                break
+            else:
+                stack.pop()
+                path.pop()
+
+    def suffixes(self, suffix="", limit=None):
+        """
+        Collects the suffix for all complete words below this point.
 
         Args:
             suffix (str): The current suffix being built (default '').
+            limit (int): Return at most this many suffixes (default no limit).
 
         Returns:
             list: A list of all suffixes of complete words starting from this node.
@@ -59,14 +120,43 @@ class TrieNode:
         Time complexity: O(n), where n is the total number of characters in all suffixes.
         Space complexity: O(n) for storing all suffixes.
         """
-        results = []
+        return list(self.iter_suffixes(suffix, limit))
 
-        if self.is_end_of_word:
-            results.append(suffix)
+    def top_k(self, k: int, suffix=""):
+        """
+        Return the k highest-weighted suffixes of complete words below this point.
+
+        Best-first search over the subtree: nodes are expanded in order of
+        their max_weight, so subtrees that cannot beat the k-th best word are
+        never visited.
 
-        for char, child_node in self.children.items():
-            results.extend(child_node.suffixes(suffix + char))
+        Args:
+            k (int): Number of suffixes to return.
+            suffix (str): Prepended to every suffix returned (default '').
+
+        Returns:
+            list: Up to k (suffix, weight) tuples, heaviest first, ties broken
+                  alphabetically.
 
+        Time complexity: O(k * d) nodes expanded, for words up to d characters
+        long and an alphabet of bounded size, plus a log factor for the heap.
+        """
+        results = []
+        counter = 0
+        # Entries are (-weight, suffix, is_node, counter, node); at equal weight
+        # and suffix a finished word sorts before the node it came from
+        heap = [(-self.max_weight, suffix, True, counter, self)]
+        while heap and len(results) < k:
+            weight, path, is_node, _, node = heapq.heappop(heap)
+            if not is_node:
+                results.append((path, -weight))
+                continue
+            if node.is_end_of_word:
+                heapq.heappush(heap, (-node.weight, path, False, 0, None))
+            for char, child_node in node.children.items():
+                counter += 1
+                priority = -child_node.max_weight
+                heapq.heappush(heap, (priority, path + char, True, counter, child_node))
         return results
 
 
@@ -79,6 +169,8 @@ class Trie:
 
     Attributes:
         root (TrieNode): The root node of the Trie.
+        minimized (bool): True if built by from_sorted, in which case nodes are
+                          shared between words and the Trie is read-only.
     """
 
     def __init__(self):
@@ -87,22 +179,112 @@ class Trie:
         """
         # Initialize this Trie (add a root node)
         self.root = TrieNode()
+        self.minimized = False
 
-    def insert(self, word: str) -> None:
+    @classmethod
+    def from_sorted(cls, words) -> "Trie":
+        """
+        Build a minimal Trie, sharing common suffixes, from sorted words.
+
+        Args:
+            words (iterable): Words in sorted order; duplicates are ignored.
+
+        Returns:
+            Trie: A read-only Trie whose nodes form a minimal acyclic automaton
+                  (DAWG), so that endings such as "-ing" are stored once.
+
+        This is the incremental algorithm of Daciuk et al. Because the input is
+        sorted, once a word diverges from the previous one the previous word's
+        tail can never gain children again. Each tail node is then either
+        replaced by an equivalent node already in the register (same end flag
+        and same children) or added to it. Every word gets weight 1.
+
+        Raises:
+            ValueError: If the words are not sorted.
+
+        Time complexity: O(n), where n is the total number of characters.
+        """
+        trie = cls()
+        root = trie.root
+        register = {}
+        # (parent, char, child) for each character of the previous word whose
+        # node has not yet been minimized
+        unchecked = []
+
+        def minimize(down_to):
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                signature = (
+                    child.is_end_of_word,
+                    tuple((c, id(node)) for c, node in child.children.items()),
+                )
+                if signature in register:
+                    parent.children[char] = register[signature]
+                else:
+                    register[signature] = child
+
+        previous = None
+        for word in words:
+            if previous is not None:
+                if word < previous:
+                    raise ValueError("Words must be given in sorted order")
+                if word == previous:
+                    continue
+            else:
+                previous = ""
+
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            minimize(common)
+
+            node = unchecked[-1][2] if unchecked else root
+            node.max_weight = 1
+            for char in word[common:]:
+                child = TrieNode()
+                child.max_weight = 1
+                node.children[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.is_end_of_word = True
+            node.weight = 1
+            previous = word
+
+        minimize(0)
+        trie.minimized = True
+        return trie
+
+    def insert(self, word: str, weight: int = 1) -> None:
         """
         Add a word to the Trie.
 
         Args:
             word (str): The word to be inserted into the Trie.
+            weight (int): Added to the word's frequency, used by top_k (default 1).
+
+        Raises:
+            TypeError: If the Trie was built by from_sorted.
 
         Time complexity: O(n), where n is the length of the word.
         Space complexity: O(n) in the worst case, if all characters are new.
         """
+        if self.minimized:
+            raise TypeError("A Trie built by from_sorted is read-only")
+
         # Add a word to the Trie
         node = self.root
+        path = [node]
         for char in word:
             node = node.insert(char)
+            path.append(node)
         node.is_end_of_word = True
+        node.weight += weight
+
+        # Keep the subtree maxima along the path up to date for top_k
+        for path_node in path:
+            if path_node.max_weight < node.weight:
+                path_node.max_weight = node.weight
 
     def find(self, prefix: str) -> TrieNode:
         """
@@ -124,6 +306,508 @@ class Trie:
                 return None
         return node
 
+    def find_fuzzy(self, prefix: str, max_edits: int = 1) -> list:
+        """
+        Find the Trie nodes whose path is within max_edits edits of this prefix.
+
+        Walks the Trie depth first carrying one row of the Levenshtein table,
+        the edit distances between the path so far and every prefix of the
+        input. A subtree is skipped as soon as the smallest entry in its row
+        exceeds max_edits, since the distance can only grow below it.
+
+        A node whose completions are already covered by a matching ancestor at
+        the same or a smaller distance is not reported again.
+
+        Args:
+            prefix (str): The possibly mistyped prefix.
+            max_edits (int): Most insertions, deletions and substitutions allowed.
+
+        Returns:
+            list: (matched prefix, distance, TrieNode) tuples, closest first.
+
+        Time complexity: O(m * v), where m is the length of the prefix and v the
+        number of nodes visited before pruning.
+        """
+        root = self.root
+        size = len(prefix)
+        first_row = list(range(size + 1))
+        matches = []
+        if first_row[-1] <= max_edits:
+            matches.append(("", first_row[-1], root))
+
+        # (node, path to node, row of node, best distance matched above it)
+        stack = [(root, "", first_row, first_row[-1])]
+        while stack:
+            node, path, row, best = stack.pop()
+            for char, child_node in node.children.items():
+                child_row = [row[0] + 1]
+                for i in range(1, size + 1):
+                    child_row.append(
+                        min(
+                            child_row[i - 1] + 1,
+                            row[i] + 1,
+                            row[i - 1] + (prefix[i - 1] != char),
+                        )
+                    )
+                if min(child_row) > max_edits:
+                    continue
+                distance = child_row[-1]
+                child_best = best
+                if distance <= max_edits and distance < best:
+                    matches.append((path + char, distance, child_node))
+                    child_best = distance
+                stack.append((child_node, path + char, child_row, child_best))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def complete_fuzzy(self, prefix: str, max_edits: int = 1, limit=None) -> list:
+        """
+        Complete a possibly mistyped prefix, closest matches first.
+
+        Args:
+            prefix (str): The possibly mistyped prefix.
+            max_edits (int): Most insertions, deletions and substitutions allowed.
+            limit (int): Return at most this many words (default no limit).
+
+        Returns:
+            list: (word, distance) tuples ordered by distance, then by the order
+                  find_fuzzy and suffixes produce them. Each word appears once,
+                  with the distance of its closest matching prefix.
+        """
+        results = []
+        seen = set()
+        for matched, distance, node in self.find_fuzzy(prefix, max_edits):
+            for word in node.iter_suffixes(matched):
+                if limit is not None and len(results) >= limit:
+                    return results
+                if word not in seen:
+                    seen.add(word)
+                    results.append((word, distance))
+        return results
+
+    def freeze(self) -> "FrozenTrie":
+        """
+        Compile the Trie into an immutable FrozenTrie.
+
+        Returns:
+            FrozenTrie: A compact snapshot with the same words, weights and
+                        completion order, which can be saved and memory-mapped.
+
+        Nodes shared by a from_sorted Trie are written out once per path, so the
+        snapshot is the size of the equivalent unminimized Trie.
+
+        Time complexity: O(n), where n is the number of nodes.
+        """
+        return FrozenTrie(FrozenTrie.encode(self.root))
+
+
+class ConcurrentTrie(Trie):
+    """
+    A Trie that many threads can read while another thread adds words.
+
+    Published nodes are never modified. Writers copy the nodes along the path
+    of each new word, link the copies into a new root and then publish it by
+    rebinding self.root, a single atomic assignment. Readers therefore never
+    take a lock: each find() starts from whichever root was published last and
+    sees a consistent snapshot, even while it iterates suffixes.
+
+    Writers are serialised by a lock, and insert_many adds a whole batch of
+    words as one new version, so a node is copied at most once per batch.
+
+    Attributes:
+        root (TrieNode): The root node of the latest published version.
+    """
+
+    def __init__(self):
+        """
+        Initialize this Trie (add a root node and the writer lock).
+        """
+        super().__init__()
+        self._write_lock = threading.Lock()
+
+    def insert(self, word: str, weight: int = 1) -> None:
+        """
+        Add a word to the Trie and publish the new version.
+
+        Time complexity: O(n), where n is the length of the word.
+        """
+        self.insert_many([word], weight)
+
+    def insert_many(self, words, weight: int = 1) -> None:
+        """
+        Add a batch of words to the Trie and publish them as one new version.
+
+        Args:
+            words (iterable): The words to be inserted into the Trie.
+            weight (int): Added to each word's frequency (default 1).
+
+        Time complexity: O(n), where n is the total length of the words.
+        """
+        if self.minimized:
+            raise TypeError("A Trie built by from_sorted is read-only")
+
+        with self._write_lock:
+            copied = set()  # ids of nodes created by this batch, safe to modify
+
+            def writable(node):
+                if id(node) in copied:
+                    return node
+                copy = TrieNode()
+                copy.children = dict(node.children)
+                copy.is_end_of_word = node.is_end_of_word
+                copy.weight = node.weight
+                copy.max_weight = node.max_weight
+                copied.add(id(copy))
+                return copy
+
+            root = writable(self.root)
+            for word in words:
+                node = root
+                path = [node]
+                for char in word:
+                    child_node = node.children.get(char)
+                    if child_node is None:
+                        child_node = TrieNode()
+                        copied.add(id(child_node))
+                    else:
+                        child_node = writable(child_node)
+                    node.children[char] = child_node
+                    node = child_node
+                    path.append(node)
+                node.is_end_of_word = True
+                node.weight += weight
+                for path_node in path:
+                    if path_node.max_weight < node.weight:
+                        path_node.max_weight = node.weight
+
+            # Publish the new version
+            self.root = root
+
+
+class RadixTrieNode:
+    """
+    Represents a node in a path-compressed (radix) Trie.
+
+    A chain of single-child nodes is stored as one node whose label holds the
+    whole run of characters, and children are only allocated once a node has
+    any, which keeps the trie compact for large vocabularies.
+
+    Attributes:
+        label (str): The characters on the edge leading into this node.
+        children (dict): Child nodes keyed by the first character of their
+                         label, or None if there are none.
+        is_end_of_word (bool): Flag indicating if this node represents
+                               the end of a word.
+    """
+
+    __slots__ = ("label", "children", "is_end_of_word")
+
+    def __init__(self, label: str = "", children=None, is_end_of_word=False):
+        """
+        Initialise a new RadixTrieNode.
+        """
+        self.label = label
+        self.children = children
+        self.is_end_of_word = is_end_of_word
+
+    def _split(self, at: int) -> None:
+        """
+        Split this node's label at position at, moving its contents to a child.
+        """
+        child = RadixTrieNode(self.label[at:], self.children, self.is_end_of_word)
+        self.label = self.label[:at]
+        self.children = {child.label[0]: child}
+        self.is_end_of_word = False
+
+    def suffixes(self, suffix=""):
+        """
+        Recursive function that collects the suffix for all complete words below this point.
+
+        Args:
+            suffix (str): The current suffix being built (default '').
+
+        Returns:
+            list: A list of all suffixes of complete words starting from this node.
+
+        Time complexity: O(n), where n is the total number of characters in all suffixes.
+        """
+        results = []
+
+        if self.is_end_of_word:
+            results.append(suffix)
+
+        if self.children:
+            for child_node in self.children.values():
+                results.extend(child_node.suffixes(suffix + child_node.label))
+
+        return results
+
+
+class RadixTrie:
+    """
+    Implements a memory-compact Trie with the same insert/find API as Trie.
+
+    Attributes:
+        root (RadixTrieNode): The root node of the Trie.
+    """
+
+    def __init__(self):
+        """
+        Initialize this Trie (add a root node).
+        """
+        self.root = RadixTrieNode()
+
+    def insert(self, word: str) -> None:
+        """
+        Add a word to the Trie.
+
+        Args:
+            word (str): The word to be inserted into the Trie.
+
+        Time complexity: O(n), where n is the length of the word.
+        """
+        node = self.root
+        i = 0
+        while i < len(word):
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(word[i])
+            if child is None:
+                node.children[word[i]] = RadixTrieNode(word[i:], None, True)
+                return
+
+            # Walk the shared part of the child's label
+            label = child.label
+            j = 1
+            while j < len(label) and i + j < len(word) and label[j] == word[i + j]:
+                j += 1
+            if j < len(label):
+                child._split(j)
+            node = child
+            i += j
+        node.is_end_of_word = True
+
+    def find(self, prefix: str) -> RadixTrieNode:
+        """
+        Find the Trie node that represents this prefix.
+
+        Args:
+            prefix (str): The prefix to search for in the Trie.
+
+        Returns:
+            RadixTrieNode: The node at the end of the prefix, or None if the prefix
+                           is not in the Trie. If the prefix ends part way along a
+                           compressed edge, a detached node is returned whose only
+                           child holds the rest of that edge.
+
+        Time complexity: O(m), where m is the length of the prefix.
+        """
+        node = self.root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i]) if node.children else None
+            if child is None:
+                return None
+            label = child.label
+            rest = prefix[i : i + len(label)]
+            if not label.startswith(rest):
+                return None
+            if len(rest) < len(label):
+                remainder = RadixTrieNode(
+                    label[len(rest) :], child.children, child.is_end_of_word
+                )
+                return RadixTrieNode(children={remainder.label[0]: remainder})
+            node = child
+            i += len(label)
+        return node
+
+
+class FrozenTrieNode:
+    """
+    A node of a FrozenTrie, read straight from its flat arrays.
+
+    Offers the same read-only interface as TrieNode: children, is_end_of_word,
+    weight, max_weight, iter_suffixes, suffixes and top_k. The traversal
+    methods are TrieNode's own, so completions come out identically.
+
+    Attributes:
+        index (int): Position of this node in the FrozenTrie's arrays.
+    """
+
+    __slots__ = ("_trie", "index")
+
+    iter_suffixes = TrieNode.iter_suffixes
+    suffixes = TrieNode.suffixes
+    top_k = TrieNode.top_k
+
+    def __init__(self, trie: "FrozenTrie", index: int):
+        self._trie = trie
+        self.index = index
+
+    @property
+    def children(self) -> dict:
+        """
+        A new dictionary of child nodes, keyed by character, in insertion order.
+        """
+        trie = self._trie
+        start, stop = trie._first_edge[self.index], trie._first_edge[self.index + 1]
+        # Nodes are numbered breadth first, so edge j always leads to node j + 1
+        return {
+            chr(trie._chars[edge]): FrozenTrieNode(trie, edge + 1)
+            for edge in range(start, stop)
+        }
+
+    @property
+    def is_end_of_word(self) -> bool:
+        return bool(self._trie._is_end[self.index])
+
+    @property
+    def weight(self) -> int:
+        return self._trie._weight[self.index]
+
+    @property
+    def max_weight(self) -> int:
+        return self._trie._max_weight[self.index]
+
+
+class FrozenTrie:
+    """
+    An immutable Trie stored as a handful of flat arrays in one buffer.
+
+    Nodes are numbered breadth first, which puts the children of each node in
+    consecutive edge slots and means edge j always leads to node j + 1. The
+    buffer holds, in native byte order:
+
+        header:      magic b"FTR1" and the node count n, as "=4sI"
+        weight:      n int64, the word weight of each node
+        max_weight:  n int64, the largest weight in each subtree
+        first_edge:  n + 1 uint32, where each node's edges start
+        chars:       n - 1 uint32, the code point on each edge
+        is_end:      n bytes, 1 if a word ends at the node
+
+    Because the arrays are read in place, load() can memory-map a saved file
+    and be ready without parsing it, with its pages shared between processes.
+
+    Attributes:
+        root (FrozenTrieNode): The root node of the Trie.
+    """
+
+    MAGIC = b"FTR1"
+    HEADER = struct.Struct("=4sI")
+
+    def __init__(self, buffer):
+        """
+        Wrap a buffer produced by encode without copying it.
+        """
+        view = memoryview(buffer).cast("B")
+        magic, nodes = self.HEADER.unpack_from(view)
+        if magic != self.MAGIC:
+            raise ValueError("Not a frozen trie")
+
+        self._buffer = buffer
+        self._view = view
+        offset = self.HEADER.size
+        for name, typecode, length in (
+            ("_weight", "q", nodes),
+            ("_max_weight", "q", nodes),
+            ("_first_edge", "I", nodes + 1),
+            ("_chars", "I", nodes - 1),
+            ("_is_end", "B", nodes),
+        ):
+            size = length * array(typecode).itemsize
+            setattr(self, name, view[offset : offset + size].cast(typecode))
+            offset += size
+        if offset != len(view):
+            raise ValueError("Frozen trie is truncated or has trailing data")
+        self.root = FrozenTrieNode(self, 0)
+
+    @classmethod
+    def encode(cls, root: TrieNode) -> bytes:
+        """
+        Serialise the trie below root into the FrozenTrie binary format.
+
+        Time complexity: O(n), where n is the number of nodes.
+        """
+        weight, max_weight = array("q"), array("q")
+        first_edge, chars, is_end = array("I"), array("I"), array("B")
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            weight.append(node.weight)
+            max_weight.append(node.max_weight)
+            is_end.append(node.is_end_of_word)
+            first_edge.append(len(chars))
+            for char, child_node in node.children.items():
+                chars.append(ord(char))
+                queue.append(child_node)
+        first_edge.append(len(chars))
+
+        header = cls.HEADER.pack(cls.MAGIC, len(weight))
+        parts = (weight, max_weight, first_edge, chars, is_end)
+        return header + b"".join(part.tobytes() for part in parts)
+
+    def find(self, prefix: str) -> FrozenTrieNode:
+        """
+        Find the Trie node that represents this prefix.
+
+        Args:
+            prefix (str): The prefix to search for in the Trie.
+
+        Returns:
+            FrozenTrieNode: The node at the end of the prefix, or None if the
+                            prefix is not in the Trie.
+
+        Time complexity: O(m * a), where m is the length of the prefix and a
+        the number of distinct characters following each node.
+        """
+        first_edge, chars = self._first_edge, self._chars
+        index = 0
+        for char in prefix:
+            code = ord(char)
+            for edge in range(first_edge[index], first_edge[index + 1]):
+                if chars[edge] == code:
+                    index = edge + 1
+                    break
+            else:
+                return None
+        return FrozenTrieNode(self, index)
+
+    def save(self, path: str) -> None:
+        """
+        Write the frozen trie to path.
+        """
+        with open(path, "wb") as f:
+            f.write(self._view)
+
+    @classmethod
+    def load(cls, path: str) -> "FrozenTrie":
+        """
+        Memory-map a frozen trie written by save.
+
+        The file is mapped read-only and used in place, so loading does not
+        depend on the size of the vocabulary. Call close() when done.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped)
+
+    def close(self) -> None:
+        """
+        Release the arrays and, for a loaded trie, unmap the file.
+        """
+        for name in ("_weight", "_max_weight", "_first_edge", "_chars", "_is_end"):
+            getattr(self, name).release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "FrozenTrie":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 def main():
     MyTrie = Trie()
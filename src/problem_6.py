@@ -1,28 +1,355 @@
-def get_min_max(ints: list) -> tuple:
+import mmap
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Marks an empty iterator, since None could be a value
+_EMPTY = object()
+
+
+# Containers whose items the min and max builtins scan in C without creating
+# new int objects; for array('q') and the like a single pairwise pass is faster
+BUILTIN_SCAN_TYPES = (list, tuple, bytes, bytearray)
+
+
+def _pairwise_min_max(iterator, first) -> tuple:
+    """
+    Scan an iterator once, comparing its items in pairs.
+
+    Comparing the two items of a pair with each other first means only the
+    smaller can be a new minimum and only the larger a new maximum, so n items
+    take about 1.5n comparisons instead of 2n.
+    """
+    min_val = max_val = first
+    for a in iterator:
+        b = next(iterator, a)
+        if b < a:
+            a, b = b, a
+        if a < min_val:
+            min_val = a
+        if b > max_val:
+            max_val = b
+    return (min_val, max_val)
+
+
+def get_min_max(ints) -> tuple:
     """
     Return a tuple(min, max) out of list of unsorted integers.
 
     Args:
-       ints(list): list of integers containing one or more integers
+       ints: list, array, bytes-like object, numpy array or any iterable of
+             integers containing one or more integers
+    Returns:
+       tuple: (min, max), or None if ints is empty
+
+    Nothing is copied: numpy arrays use their own min and max reductions,
+    lists, tuples and bytes-like objects the min and max builtins, and any
+    other iterable, such as an array or a generator, is consumed once
+    comparing its items in pairs.
+
+    Time complexity: O(n)
     """
-    if not ints:
+    # numpy is never imported here; an ndarray means it is already loaded
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(ints, np.ndarray):
+        if not ints.size:
+            return None
+        return (ints.min().item(), ints.max().item())
+
+    if isinstance(ints, BUILTIN_SCAN_TYPES):
+        if not len(ints):
+            return None
+        return (min(ints), max(ints))
+
+    iterator = iter(ints)
+    first = next(iterator, _EMPTY)
+    if first is _EMPTY:
         return None
+    return _pairwise_min_max(iterator, first)
 
-    min_val = max_val = ints[0]
 
-    for num in ints[1:]:
-        if num < min_val:
-            min_val = num
-        elif num > max_val:
-            max_val = num
+class MinMaxWindow:
+    """
+    Tracks the min and max of the last size values pushed from a stream.
 
-    return (min_val, max_val)
+    Keeps two monotonic deques of (position, value): candidates for the
+    minimum in increasing order and candidates for the maximum in decreasing
+    order. A value that can never again be the min (or max) of the window,
+    because a newer value is at least as good, is dropped as soon as that
+    newer value arrives.
 
+    Attributes:
+        size (int): Number of most recent values the window covers.
+        count (int): Total number of values pushed so far.
+    """
 
-### Example Test Case of Ten Integers
-import random
+    def __init__(self, size: int):
+        """
+        Initialise an empty window.
+
+        Time complexity: O(1)
+        """
+        if size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.size = size
+        self.count = 0
+        self._mins = deque()
+        self._maxes = deque()
+
+    def push(self, value) -> None:
+        """
+        Add a value, dropping the oldest one once the window is full.
+
+        Time complexity: O(1) amortised, as each value enters and leaves each
+        deque at most once
+        """
+        position = self.count
+        self.count += 1
+        mins, maxes = self._mins, self._maxes
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((position, value))
+        while maxes and maxes[-1][1] <= value:
+            maxes.pop()
+        maxes.append((position, value))
+
+        oldest = position - self.size
+        if mins[0][0] <= oldest:
+            mins.popleft()
+        if maxes[0][0] <= oldest:
+            maxes.popleft()
+
+    def get_min_max(self) -> tuple:
+        """
+        Return a tuple(min, max) of the values in the window.
+
+        Returns:
+           tuple: (min, max), or None if nothing has been pushed yet
+
+        Time complexity: O(1)
+        """
+        if not self.count:
+            return None
+        return (self._mins[0][1], self._maxes[0][1])
+
+
+class MinMaxSummary:
+    """
+    The min, max and count of a partition of the data, which can be merged.
+
+    Workers summarise their own partitions, with from_values or push, and the
+    summaries are merged into the result for the whole data set.
+
+    Attributes:
+        count (int): Number of values summarised.
+        min_val: Smallest value, or None if count is 0.
+        max_val: Largest value, or None if count is 0.
+    """
+
+    __slots__ = ("count", "min_val", "max_val")
+
+    def __init__(self, count: int = 0, min_val=None, max_val=None):
+        self.count = count
+        self.min_val = min_val
+        self.max_val = max_val
+
+    @classmethod
+    def from_values(cls, ints) -> "MinMaxSummary":
+        """
+        Summarise a partition, accepting anything get_min_max does.
+
+        Time complexity: O(n)
+        """
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(ints, np.ndarray):
+            count = ints.size
+        elif hasattr(ints, "__len__"):
+            count = len(ints)
+        else:
+            # One-shot iterables are counted as they are consumed
+            summary = cls()
+            for value in ints:
+                summary.push(value)
+            return summary
+
+        result = get_min_max(ints)
+        if result is None:
+            return cls()
+        return cls(count, *result)
+
+    def push(self, value) -> None:
+        """
+        Add one value to the summary.
+
+        Time complexity: O(1)
+        """
+        if not self.count or value < self.min_val:
+            self.min_val = value
+        if not self.count or value > self.max_val:
+            self.max_val = value
+        self.count += 1
+
+    def merge(self, other: "MinMaxSummary") -> "MinMaxSummary":
+        """
+        Return the summary of both partitions together.
+
+        Time complexity: O(1)
+        """
+        if not other.count:
+            return MinMaxSummary(self.count, self.min_val, self.max_val)
+        if not self.count:
+            return MinMaxSummary(other.count, other.min_val, other.max_val)
+        return MinMaxSummary(
+            self.count + other.count,
+            other.min_val if other.min_val < self.min_val else self.min_val,
+            other.max_val if other.max_val > self.max_val else self.max_val,
+        )
+
+    def get_min_max(self) -> tuple:
+        """
+        Return a tuple(min, max), or None if the summary is empty.
+        """
+        if not self.count:
+            return None
+        return (self.min_val, self.max_val)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MinMaxSummary):
+            return NotImplemented
+        return (self.count, self.min_val, self.max_val) == (
+            other.count,
+            other.min_val,
+            other.max_val,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"MinMaxSummary(count={self.count}, "
+            f"min_val={self.min_val!r}, max_val={self.max_val!r})"
+        )
+
+
+def _chunk_min_max(view: memoryview) -> tuple:
+    """
+    Reduce one chunk of a typed memoryview to (min, max) without copying it.
+
+    Uses NumPy's vectorised reductions when available, which also release the
+    GIL, and the pairwise scan of get_min_max otherwise.
+    """
+    if not len(view):
+        return None
+    try:
+        import numpy as np
+    except ImportError:  # numpy is optional, the pure Python path is used without it
+        np = None
+    if np is not None:
+        values = np.frombuffer(view, dtype=view.format)
+        return (values.min().item(), values.max().item())
+    return get_min_max(view)
+
+
+def _merge_min_max(results) -> tuple:
+    """
+    Merge partial (min, max) tuples, skipping empty chunks.
+    """
+    summary = MinMaxSummary()
+    for result in results:
+        if result is not None:
+            summary = summary.merge(MinMaxSummary(1, *result))
+    return summary.get_min_max()
+
+
+def _chunk_bounds(length: int, workers: int) -> list:
+    """
+    Split range(length) into at most workers contiguous (start, stop) chunks.
+    """
+    chunk_size = max(1, -(-length // workers))
+    return [
+        (start, min(start + chunk_size, length))
+        for start in range(0, length, chunk_size)
+    ]
+
+
+def get_min_max_parallel(buffer, workers=None, typecode: str = "q") -> tuple:
+    """
+    Return a tuple(min, max) out of a buffer of fixed-width integers.
+
+    Args:
+       buffer: bytes, bytearray, array, mmap or anything with the buffer protocol
+       workers(int): Number of threads, defaults to the CPU count
+       typecode(str): struct format of one element, "q" for native int64
+    Returns:
+       tuple: (min, max), or None if the buffer is empty
+
+    The buffer is viewed in place as typecode and split into one chunk per
+    worker. The chunks are reduced in a thread pool rather than a process
+    pool, so nothing is copied or pickled; the NumPy kernel releases the GIL,
+    so the threads run in parallel when NumPy is installed.
+
+    Time complexity: O(n / workers) with NumPy, O(n) otherwise
+    """
+    view = memoryview(buffer).cast("B").cast(typecode)
+    workers = workers or os.cpu_count() or 1
+    chunks = [view[start:stop] for start, stop in _chunk_bounds(len(view), workers)]
+    with ThreadPoolExecutor(workers) as executor:
+        return _merge_min_max(executor.map(_chunk_min_max, chunks))
+
+
+def _file_chunk_min_max(path: str, typecode: str, start: int, stop: int) -> tuple:
+    """
+    Map a file in a worker process and reduce elements start to stop.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped).cast(typecode) as view:
+                with view[start:stop] as chunk:
+                    return _chunk_min_max(chunk)
+
+
+def get_min_max_file(path: str, typecode: str = "q", workers=None) -> tuple:
+    """
+    Return a tuple(min, max) out of a binary file of fixed-width integers.
+
+    Args:
+       path(str): File of native byte order integers
+       typecode(str): struct format of one element, "q" for native int64
+       workers(int): Number of worker processes, defaults to the CPU count
+    Returns:
+       tuple: (min, max), or None if the file is empty
+
+    Each worker process memory-maps the file itself and reduces its own
+    element range, so only the path and offsets are sent to it. The partial
+    (min, max) tuples are then merged.
+
+    Time complexity: O(n / workers)
+    """
+    itemsize = memoryview(b"").cast(typecode).itemsize
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(f"File size is not a multiple of {itemsize} bytes")
+    length = size // itemsize
+    if not length:
+        return None
+
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(length, workers)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(_file_chunk_min_max, path, typecode, start, stop)
+            for start, stop in bounds
+        ]
+        return _merge_min_max(future.result() for future in futures)
+
+
+def main():
+    # Example Test Case of Ten Integers
+    l = [i for i in range(0, 10)]  # a list containing 0 - 9
+    random.shuffle(l)
+
+    print("Pass" if ((0, 9) == get_min_max(l)) else "Fail")
 
-l = [i for i in range(0, 10)]  # a list containing 0 - 9
-random.shuffle(l)
 
-print("Pass" if ((0, 9) == get_min_max(l)) else "Fail")
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,38 @@
+import re
+from collections import OrderedDict
+
+# Runs of slashes, collapsed to one by normalize_path
+_SLASHES = re.compile("/{2,}")
+
+# Matching priority of the child slots of a RouteTrieNode, tried in this order
+STATIC, PARAM, WILDCARD = 1, 2, 3
+
+
+def normalize_path(path: str) -> str:
+    """
+    Normalise a path to the canonical form used as a static route key.
+
+    Duplicate slashes are collapsed and the trailing slash removed, so
+    "/home//about/" becomes "/home/about" and "" becomes "/". This matches the
+    parts RouteTrie.split_path produces, without building a list of them.
+
+    Args:
+        path (str): The path to normalise.
+
+    Returns:
+        str: The normalised path, always starting with a single "/".
+
+    Time complexity: O(n), where n is the length of the path
+    """
+    if "//" in path:
+        path = _SLASHES.sub("/", path)
+    if path.endswith("/"):
+        path = path[:-1]
+    if not path.startswith("/"):
+        path = "/" + path
+    return path
+
+
 # A RouteTrieNode will be similar to our autocomplete TrieNode... with one additional element, a handler.
 class RouteTrieNode:
     """
@@ -6,9 +41,16 @@ class RouteTrieNode:
     Uses a dictionary to store children, which allows for fast lookups
     (O(1) on average).
 
+    Path parameters and wildcards get their own child slots instead of
+    entries in children, so matching a segment never scans the children.
+
     Attributes:
         children (dict): A dictionary to store child nodes.
         handler: The handler associated with this node (if it's an endpoint).
+        param_child (RouteTrieNode): Child matching any one segment, or None.
+        param_name (str): Name the param_child segment is captured under.
+        wildcard_handler: Handler for a catch-all below this node, or None.
+        wildcard_name (str): Name the catch-all segments are captured under.
     """
 
     def __init__(self, *args):
@@ -24,6 +66,10 @@ class RouteTrieNode:
         # Initialize the node with children as before, plus a handler
         self.children = {}
         self.handler = None
+        self.param_child = None
+        self.param_name = None
+        self.wildcard_handler = None
+        self.wildcard_name = None
 
     def insert(self, *args):
         """
@@ -45,6 +91,26 @@ class RouteTrieNode:
             if path_part not in self.children:
                 self.children[path_part] = RouteTrieNode()
 
+    def insert_param(self, name):
+        """
+        Creates the child slot matching any one segment, captured as name.
+
+        Args:
+            name (str): Name of the path parameter, without the ":".
+
+        Raises:
+            ValueError: If the slot exists under a different name.
+
+        Time complexity: O(1)
+        """
+        if self.param_child is None:
+            self.param_child = RouteTrieNode()
+            self.param_name = name
+        elif self.param_name != name:
+            raise ValueError(
+                f"Parameter :{name} conflicts with :{self.param_name} at the same level"
+            )
+
 
 # A RouteTrie will store our routes and their associated handlers
 class RouteTrie:
@@ -56,6 +122,12 @@ class RouteTrie:
     We use a trie is used because it allows us to efficiently store
     and retrieve paths, taking advantage of common prefixes in URLs.
 
+    Besides literal segments, a route can contain ":name" segments, which
+    match any one segment, and end with a "*name" segment, which matches
+    one or more remaining segments. The matched segments are captured under
+    their names, for example "/users/:id/*rest" captures
+    {"id": "42", "rest": "orders/7"} from "/users/42/orders/7".
+
     Attributes:
         root (RouteTrieNode): The root node of the trie.
     """
@@ -83,13 +155,19 @@ class RouteTrie:
 
         Breaks down the path into parts and creates nodes as needed.
         We traverse or create a node for each part of the path, setting the handler
-        on the last node.
+        on the last node. A ":name" part goes into the param slot of its node and a
+        "*name" part sets the wildcard handler of its node.
 
         Args:
             *args: Variable length argument list.
                 args[0] (str): The path to insert.
                 args[1]: The handler for the path.
 
+        Raises:
+            ValueError: If a "*name" part is not the last one, a parameter has
+                no name, or a parameter is named differently from one already
+                at the same level.
+
         Time complexity: O(n) where n is the number of parts in the path
         """
         # Similar to our previous example you will want to recursively add nodes
@@ -103,9 +181,26 @@ class RouteTrie:
             path
         )  # moved method here because I did not know how best to call it form outside
 
-        for part in path_parts:
-            current_node.insert(part)
-            current_node = current_node.children[part]
+        for i, part in enumerate(path_parts):
+            if part[0] in ":*" and len(part) == 1:
+                raise ValueError(f"Parameter in {path!r} has no name")
+            if part[0] == "*":
+                if i != len(path_parts) - 1:
+                    raise ValueError(f"Wildcard must be the last part of {path!r}")
+                if current_node.wildcard_name not in (None, part[1:]):
+                    raise ValueError(
+                        f"Wildcard {part} conflicts with "
+                        f"*{current_node.wildcard_name} at the same level"
+                    )
+                current_node.wildcard_handler = handler
+                current_node.wildcard_name = part[1:]
+                return
+            if part[0] == ":":
+                current_node.insert_param(part[1:])
+                current_node = current_node.param_child
+            else:
+                current_node.insert(part)
+                current_node = current_node.children[part]
 
         current_node.handler = handler
 
@@ -127,16 +222,58 @@ class RouteTrie:
         if len(args) < 1:
             return None
 
-        path = args[0]
-        current_node = self.root
-        path_parts = self.split_path(path)
+        return self.match(args[0])[0]
+
+    def match(self, path):
+        """
+        Finds the handler for a given path and the parameters it captures.
 
-        for part in path_parts:
-            if part not in current_node.children:
-                return None
-            current_node = current_node.children[part]
+        At each node a segment is matched against the static children first,
+        then the param slot, then the wildcard. If the path cannot be matched
+        one level further down, we backtrack that one level and try the next
+        slot there; we never backtrack further than that.
 
-        return current_node.handler
+        Args:
+            path (str): The path to find.
+
+        Returns:
+            tuple: (handler, params), where params is a dict of the captured
+                segments, or (None, {}) if nothing matches.
+
+        Time complexity: O(n) where n is the number of parts in the path, as
+        each part is matched at most twice
+        """
+        parts = self.split_path(path)
+        params = {}
+        node, i, after = self.root, 0, 0
+        retry = None  # (node, i, slot) of the last step, to backtrack to
+
+        while True:
+            slot = 0
+            if i == len(parts):
+                if node.handler is not None:
+                    return node.handler, params
+            else:
+                part = parts[i]
+                if after < STATIC and part in node.children:
+                    slot, child = STATIC, node.children[part]
+                elif after < PARAM and node.param_child is not None:
+                    slot, child = PARAM, node.param_child
+                    params[node.param_name] = part
+                elif after < WILDCARD and node.wildcard_handler is not None:
+                    params[node.wildcard_name] = "/".join(parts[i:])
+                    return node.wildcard_handler, params
+
+            if slot:
+                retry = (node, i, slot)
+                node, i, after = child, i + 1, 0
+                continue
+            if retry is None:
+                return None, {}
+            node, i, after = retry
+            retry = None
+            if after == PARAM:
+                del params[node.param_name]
 
     def split_path(self, path):
         """
@@ -164,12 +301,27 @@ class Router:
     Provides a higher-level interface for working with routes. It encapsulates
     the RouteTrie and provides methods for adding handlers and looking up paths.
 
+    Alongside the trie, every static route, one without ":name" or "*name"
+    parts, is kept in a static route table, a dict from normalised path to
+    handler, so most lookups are a single hash lookup. The trie is only walked
+    when the table has no handler for the path. Static routes take priority
+    over parameters in the trie too, so both give the same answer.
+
+    With cache_size set, results are also kept in a bounded LRU cache keyed by
+    the raw path string, for traffic where a few paths take most lookups.
+    Misses are cached too, as the not_found_handler. Adding a handler or
+    recompiling empties the cache.
+
     Attributes:
         route_trie (RouteTrie): The trie used to store routes.
         not_found_handler: The handler to use when a route is not found.
+        cache_size (int): Maximum number of cached paths, 0 for no cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to match the path.
+        evictions (int): Number of paths dropped to stay within cache_size.
     """
 
-    def __init__(self, *args):
+    def __init__(self, *args, cache_size: int = 0):
         """
         Initialises the Router.
 
@@ -179,15 +331,44 @@ class Router:
             *args: Variable length argument list.
                 args[0]: The handler for the root path.
                 args[1]: The handler for not found routes.
+            cache_size (int): Number of paths to cache, 0 disables the cache.
 
         Time complexity: O(1)
         """
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative")
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
         if len(args) >= 2:
             root_handler, not_found_handler = args[0], args[1]
         else:
             root_handler, not_found_handler = None, None
         self.route_trie = RouteTrie(root_handler)
         self.not_found_handler = not_found_handler
+        self.compile()
+
+    def compile(self):
+        """
+        Rebuild the static route table from the RouteTrie.
+
+        add_handler keeps the table up to date, so this is only needed after
+        inserting into route_trie directly.
+
+        Time complexity: O(n), where n is the number of nodes in the trie
+        """
+        static = {}
+        stack = [("", self.route_trie.root)]
+        while stack:
+            path, node = stack.pop()
+            if node.handler is not None:
+                static[path or "/"] = node.handler
+            for part, child in node.children.items():
+                stack.append((path + "/" + part, child))
+        self._static = static
+        self._cache.clear()
 
     def add_handler(self, *args):
         """
@@ -203,6 +384,19 @@ class Router:
         if len(args) >= 2:
             path, handler = args[0], args[1]
             self.route_trie.insert(path, handler)
+            path = normalize_path(path)
+            if "/:" not in path and "/*" not in path:
+                self._static[path] = handler
+            self._cache.clear()
+
+    def clear_cache(self):
+        """
+        Empty the lookup cache and reset the hit/miss/eviction counters.
+        """
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def lookup(self, *args):
         """
@@ -215,16 +409,67 @@ class Router:
         Returns:
             The handler for the path if found, otherwise the not_found_handler.
 
-        Time complexity: O(n), where n is the number of parts in the path
+        Time complexity: O(n), where n is the length of the path, for the hash
+        lookup in the static route table
         """
         if len(args) < 1:
             return self.not_found_handler
 
-        path = args[0]
+        if self.cache_size:
+            return self._cached_match(args[0])[0]
+        return self._match(args[0])[0]
+
+    def match(self, path):
+        """
+        Looks up a path and the parameters it captures.
+
+        Args:
+            path (str): The path to look up.
+
+        Returns:
+            tuple: (handler, params), where params is a dict of the segments
+                captured by ":name" and "*name" parts. The handler is the
+                not_found_handler, with no params, if nothing matches.
+
+        Time complexity: O(n), where n is the length of the path
+        """
+        if self.cache_size:
+            handler, params = self._cached_match(path)
+            # Callers get their own copy of the cached params
+            return handler, dict(params)
+        return self._match(path)
+
+    def _cached_match(self, path):
+        """
+        Return the match result for path from the LRU cache, filling it on a miss.
+        """
+        cache = self._cache
+        result = cache.get(path)
+        if result is not None:
+            cache.move_to_end(path)
+            self.hits += 1
+            return result
+
+        result = self._match(path)
+        self.misses += 1
+        cache[path] = result
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def _match(self, path):
+        """
+        Match path against the static route table, then the RouteTrie.
+        """
+        handler = self._static.get(normalize_path(path))
+        if handler is not None:
+            return handler, {}
+
         if path == "/":
-            return self.route_trie.root.handler
+            return self.route_trie.root.handler, {}
 
-        handler = self.route_trie.find(path)
+        handler, params = self.route_trie.match(path)
         if handler is None:
-            return self.not_found_handler
-        return handler
+            return self.not_found_handler, {}
+        return handler, params
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+# Reports on stderr whether the import loaded numpy, keeping stdout for
+# whatever the import itself printed
+IMPORT_CHECK = """\
+import sys
+import {module}
+print("numpy" in sys.modules, file=sys.stderr)
+"""
+
+
+@pytest.mark.parametrize("module", [f"src.problem_{n}" for n in range(1, 8)])
+def test_import_has_no_side_effects(module):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "", f"Importing {module} should not print anything"
+    assert result.stderr == "False\n", f"Importing {module} should not import numpy"
@@ -1,5 +1,7 @@
+from array import array
+
 import pytest
-from src.problem_1 import sqrt
+from src.problem_1 import SqrtCache, _recursive_sqrt, sqrt, sqrt_big, sqrt_many
 
 
 def test_sqrt_0_is_0():
@@ -23,3 +25,87 @@ def test_sqrt_9_is_3():
 
 def test_sqrt_27_is_5():
     assert sqrt(27) == 5
+
+
+def test_sqrt_many_matches_sqrt():
+    values = [
+        0,
+        1,
+        2,
+        3,
+        4,
+        15,
+        16,
+        17,
+        27,
+        2**52 + 1,
+        2**62,
+        2**63 - 1,
+        2**80 + 5,
+    ]
+    assert sqrt_many(values) == [sqrt(v) for v in values]
+
+
+def test_sqrt_many_accepts_int64_array():
+    values = array("q", [9, 26, 2**63 - 1])
+    assert list(sqrt_many(values)) == [3, 5, sqrt(2**63 - 1)]
+
+
+def test_sqrt_many_negative_returns_error():
+    with pytest.raises(
+        ValueError, match="Cannot compute square root of negative number"
+    ):
+        sqrt_many([4, -1])
+
+
+def test_sqrt_many_ndarray_dtypes():
+    np = pytest.importorskip("numpy")
+    values = np.array([9, 2**63, 2**64 - 1], dtype=np.uint64)
+    assert sqrt_many(values).tolist() == [3, sqrt(2**63), sqrt(2**64 - 1)]
+    with pytest.raises(TypeError):
+        sqrt_many(np.array([2.5, 9.0]))
+
+
+def test_sqrt_big_matches_sqrt():
+    for number in list(range(200)) + [2**64 - 1, 2**64, 3**200, 7**301 + 12]:
+        assert sqrt_big(number) == sqrt(number)
+
+
+def test_recursive_sqrt_is_floored_root():
+    for number in [2, 3, 4, 99, 2**127 - 1, 10**100, 10**100 - 1]:
+        root = _recursive_sqrt(number)
+        assert root * root <= number < (root + 1) * (root + 1)
+
+
+def test_sqrt_big_negative_returns_error():
+    with pytest.raises(
+        ValueError, match="Cannot compute square root of negative number"
+    ):
+        sqrt_big(-4)
+
+
+def test_sqrt_cache_table_matches_sqrt():
+    cached_sqrt = SqrtCache(table_bound=500)
+    assert [cached_sqrt(n) for n in range(600)] == [sqrt(n) for n in range(600)]
+
+
+def test_sqrt_cache_counts_hits_and_evicts_lru():
+    cached_sqrt = SqrtCache(maxsize=2, table_bound=0)
+    cached_sqrt(100)
+    cached_sqrt(200)
+    assert cached_sqrt(100) == 10
+    cached_sqrt(300)  # evicts 200, the least recently used
+    assert (cached_sqrt.hits, cached_sqrt.misses) == (1, 3)
+    assert len(cached_sqrt) == 2
+    cached_sqrt(200)
+    assert cached_sqrt.misses == 4
+
+    cached_sqrt.clear()
+    assert (len(cached_sqrt), cached_sqrt.hits, cached_sqrt.misses) == (0, 0, 0)
+
+
+def test_sqrt_cache_negative_returns_error():
+    with pytest.raises(
+        ValueError, match="Cannot compute square root of negative number"
+    ):
+        SqrtCache(table_bound=16)(-1)
@@ -1,13 +1,122 @@
-from src.problem_2 import rotated_array_search
+import random
+from array import array
+
+import pytest
+from src.problem_2 import (
+    RotatedSortedFile,
+    RotatedSortedIndex,
+    find_pivot,
+    int_view,
+    linear_search,
+    rotated_array_search,
+    rotated_array_search_first,
+    search_file_main,
+)
 
 
 def test_rotated_array_search_6():
     input = [6, 7, 8, 9, 10, 1, 2, 3, 4]
     n = 6
-    assert rotated_array_search(input, n) == 6
+    assert rotated_array_search(input, n) == 0
 
 
-def test_rotated_array_search_6():
+def test_rotated_array_search_33():
     input = [6, 7, 8, 9, 10, 1, 2, 3, 4]
     n = 33
     assert rotated_array_search(input, n) == -1
+
+
+def test_rotated_array_search_returns_index():
+    input = [6, 7, 8, 1, 2, 3, 4]
+    for n in input:
+        assert rotated_array_search(input, n) == input.index(n)
+
+
+def test_rotated_sorted_index_pivot():
+    assert RotatedSortedIndex([6, 7, 8, 9, 10, 1, 2, 3, 4]).pivot == 5
+    assert RotatedSortedIndex([1, 2, 3]).pivot == 0
+    assert RotatedSortedIndex([]).pivot == 0
+
+
+def test_rotated_sorted_index_search_matches_linear_search():
+    for input in ([6, 7, 8, 9, 10, 1, 2, 3, 4], [1, 2, 3, 4], [4, 1], [5], []):
+        index = RotatedSortedIndex(input)
+        for n in range(0, 12):
+            assert index.search(n) == linear_search(input, n)
+
+
+def test_rotated_sorted_index_search_many():
+    input = [6, 7, 8, 9, 10, 1, 2, 3, 4]
+    index = RotatedSortedIndex(input)
+    sorted_targets = [0, 1, 3, 5, 6, 9, 10, 11]
+    unsorted_targets = [9, 1, 5, 6, 4]
+    for targets in (sorted_targets, unsorted_targets):
+        assert index.search_many(targets) == [linear_search(input, n) for n in targets]
+
+
+def test_find_pivot_with_duplicates():
+    assert find_pivot([2, 2, 2, 3, 1, 2, 2]) == 4
+    assert find_pivot([1, 2, 1, 1, 1]) == 2
+    assert find_pivot([2, 1, 1, 1, 1, 1, 2]) == 1
+    assert find_pivot([2, 2, 2]) == 0
+
+
+def test_rotated_array_search_first_with_duplicates():
+    input = [2, 2, 2, 3, 1, 2, 2]
+    assert rotated_array_search_first(input, 1) == 4
+    assert rotated_array_search_first(input, 2) == 0
+    assert rotated_array_search_first(input, 3) == 3
+    assert rotated_array_search_first(input, 5) == -1
+
+
+def test_rotated_array_search_first_matches_linear_search():
+    rng = random.Random(7)
+    for _ in range(500):
+        values = sorted(rng.randrange(4) for _ in range(rng.randrange(1, 12)))
+        pivot = rng.randrange(len(values))
+        input = values[pivot:] + values[:pivot]
+        for n in range(-1, 5):
+            assert rotated_array_search_first(input, n) == linear_search(input, n)
+
+
+def test_rotated_sorted_index_on_int_view():
+    input = [6, 7, 8, 9, 10, 1, 2, 3, 4]
+    view = int_view(array("q", input).tobytes())
+    index = RotatedSortedIndex(view)
+    assert [index.search(n) for n in range(12)] == [
+        linear_search(input, n) for n in range(12)
+    ]
+
+
+def test_rotated_sorted_file(tmp_path):
+    input = [6, 7, 8, 9, 10, 1, 2, 3, 4]
+    path = tmp_path / "keys.bin"
+    with open(path, "wb") as f:
+        array("q", input).tofile(f)
+
+    with RotatedSortedFile(path) as rotated_file:
+        assert len(rotated_file) == len(input)
+        assert rotated_file.search(1) == 5
+        assert rotated_file.search(5) == -1
+        assert rotated_file.search_many([1, 4, 6, 10]) == [5, 8, 0, 4]
+
+
+def test_rotated_sorted_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with RotatedSortedFile(path) as rotated_file:
+        assert rotated_file.search(1) == -1
+
+
+def test_rotated_sorted_truncated_file(tmp_path):
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(array("q", [1, 2, 3]).tobytes()[:-1])
+    with pytest.raises(ValueError, match="multiple of 8 bytes"):
+        RotatedSortedFile(path)
+
+
+def test_search_file_main(tmp_path, capsys):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(array("q", [6, 7, 8, 1, 2, 3, 4]).tobytes())
+    search_file_main([str(path), "8", "1", "5"])
+    assert capsys.readouterr().out.split() == ["2", "3", "-1"]
@@ -1,4 +1,13 @@
-from src.problem_3 import rearrange_digits
+import io
+import random
+
+import pytest
+from src.problem_3 import (
+    count_digits,
+    count_digits_parallel,
+    rearrange_digits,
+    rearrange_digits_stream,
+)
 
 
 def test_rearrange_digits_531_42():
@@ -9,3 +18,72 @@ def test_rearrange_digits_531_42():
 def test_rearrange_digits_531_42():
     input_list = [4, 6, 2, 5, 9, 8]
     assert rearrange_digits(input_list) == [964, 852]
+
+
+def test_rearrange_digits_stream_matches_rearrange_digits():
+    rng = random.Random(3)
+    cases = [[], [0], [5], [0, 0], [1, 0, 0], [0, 0, 0, 0, 1], [1, 2, 3, 4, 5]]
+    cases += [[rng.randrange(10) for _ in range(rng.randrange(40))] for _ in range(50)]
+    for input_list in cases:
+        expected = [str(n) for n in rearrange_digits(input_list)]
+        assert rearrange_digits_stream(input_list) == expected
+
+
+def test_rearrange_digits_stream_bytes_and_files():
+    assert rearrange_digits_stream(b"465298") == ["964", "852"]
+    assert rearrange_digits_stream(b"465298", as_bytes=True) == [b"964", b"852"]
+    assert rearrange_digits_stream(io.BytesIO(b"12345\n")) == ["531", "42"]
+
+
+def test_rearrange_digits_stream_rejects_non_digits():
+    with pytest.raises(ValueError):
+        rearrange_digits_stream(b"12a45")
+
+
+def test_count_digits_parallel_matches_count_digits():
+    rng = random.Random(5)
+    digits = [rng.randrange(10) for _ in range(1000)]
+    ascii_digits = "".join(map(str, digits)).encode()
+    expected = count_digits(digits)
+    for input in (digits, iter(digits), ascii_digits, io.BytesIO(ascii_digits)):
+        assert count_digits_parallel(input, workers=2, chunk_size=64) == expected
+
+
+def test_rearrange_digits_stream_parallel():
+    digits = [4, 6, 2, 5, 9, 8] * 50
+    assert rearrange_digits_stream(digits, workers=2) == rearrange_digits_stream(digits)
+
+
+def test_count_digits_parallel_rejects_non_digits():
+    with pytest.raises(ValueError):
+        count_digits_parallel([1, 2, 10], workers=1)
+
+
+def test_rearrange_digits_base_16():
+    assert rearrange_digits([15, 0, 10, 1], base=16) == [0xF1, 0xA0]
+
+
+def test_rearrange_digits_k_outputs():
+    assert rearrange_digits([1, 2, 3, 4, 5, 6, 7], k=3) == [741, 63, 52]
+    assert rearrange_digits([9, 9], k=4) == [9, 9, 0, 0]
+
+
+def test_rearrange_digits_base_256_matches_sorted():
+    rng = random.Random(11)
+    digits = [rng.randrange(256) for _ in range(500)]
+    ordered = sorted(digits, reverse=True)
+    expected = [int.from_bytes(bytes(ordered[j::3]), "big") for j in range(3)]
+    assert rearrange_digits(digits, base=256, k=3) == expected
+
+
+@pytest.mark.parametrize("input_list", [[1, 10], [1, -1], [3, 16]])
+def test_rearrange_digits_rejects_invalid_digits(input_list):
+    with pytest.raises(ValueError):
+        rearrange_digits(input_list)
+
+
+def test_rearrange_digits_rejects_invalid_base_and_k():
+    with pytest.raises(ValueError):
+        rearrange_digits([1], base=1)
+    with pytest.raises(ValueError):
+        rearrange_digits([1], k=0)
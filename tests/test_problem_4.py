@@ -1,4 +1,13 @@
-from src.problem_4 import sort_012
+import random
+from array import array
+
+import pytest
+from src.problem_4 import (
+    partition_by_key,
+    sort_012,
+    sort_012_counting,
+    sort_012_parallel,
+)
 
 
 def test_sort_012_returns_0():
@@ -11,3 +20,69 @@ def test_sort_012_returns_012():
 
 def test_sort_012_returns_002():
     assert sort_012([2, 0, 0]) == [0, 0, 2]
+
+
+def test_sort_012_counting_matches_sort_012():
+    rng = random.Random(2)
+    for size in range(20):
+        input_list = [rng.randrange(3) for _ in range(size)]
+        assert sort_012_counting(list(input_list)) == sort_012(list(input_list))
+
+
+def test_sort_012_counting_sorts_buffers_in_place():
+    values = [2, 1, 2, 0, 0, 2, 1, 0]
+    for input_list in (list(values), bytearray(values), array("b", values)):
+        result = sort_012_counting(input_list)
+        assert result is input_list
+        assert list(result) == sorted(values)
+
+
+def test_sort_012_counting_rejects_other_values():
+    with pytest.raises(ValueError):
+        sort_012_counting([0, 3, 1])
+
+
+@pytest.mark.parametrize("k", [1, 3, 5, 256])
+def test_partition_by_key_groups_keys(k):
+    rng = random.Random(k)
+    items = [(rng.randrange(k), i) for i in range(300)]
+    result = partition_by_key(list(items), key=lambda item: item[0], k=k)
+    assert [item[0] for item in result] == sorted(item[0] for item in items)
+    assert sorted(result) == sorted(items)
+
+
+@pytest.mark.parametrize("k", [3, 7])
+def test_partition_by_key_stable(k):
+    rng = random.Random(k)
+    items = [(rng.randrange(k), i) for i in range(300)]
+    result = partition_by_key(list(items), key=lambda item: item[0], k=k, stable=True)
+    assert result == sorted(items, key=lambda item: item[0])
+
+
+@pytest.mark.parametrize("k", [3, 4])
+def test_partition_by_key_rejects_keys_out_of_range(k):
+    with pytest.raises(ValueError):
+        partition_by_key([0, 1, k], key=lambda item: item, k=k)
+
+
+@pytest.mark.parametrize("k", [3, 4])
+def test_partition_by_key_leaves_input_unchanged_on_error(k):
+    items = [2, 0, 1, 5, 0]
+    with pytest.raises(ValueError):
+        partition_by_key(items, key=lambda item: item, k=k)
+    assert items == [2, 0, 1, 5, 0]
+
+
+def test_sort_012_parallel_matches_sort_012():
+    rng = random.Random(4)
+    values = [rng.randrange(3) for _ in range(1001)]
+    expected = sort_012(list(values))
+    for input_list in (list(values), bytearray(values), array("b", values)):
+        result = sort_012_parallel(input_list, workers=3)
+        assert result is input_list
+        assert list(result) == expected
+
+
+def test_sort_012_parallel_rejects_other_values():
+    with pytest.raises(ValueError):
+        sort_012_parallel([0, 5, 1], workers=2)
@@ -1,3 +1,6 @@
+import random
+import threading
+
 import pytest
 from src.problem_5 import *
 
@@ -114,3 +117,251 @@ def test_trienode_suffixes():
 
     # Test case 3: Suffixes from root node
     assert set(trie.root.suffixes()) == set(words), "Incorrect suffixes from root"
+
+
+def test_trie_node_uses_slots():
+    node = TrieNode()
+    assert not hasattr(node, "__dict__"), "TrieNode should not have a __dict__"
+
+
+def test_radix_trie_matches_trie():
+    rng = random.Random(5)
+    words = ["ant", "anthology", "antagonist", "antonym", "fun", "function", "a"]
+    for _ in range(200):
+        words.append("".join(rng.choice("abc") for _ in range(rng.randrange(1, 7))))
+    trie, radix_trie = Trie(), RadixTrie()
+    for word in words:
+        trie.insert(word)
+        radix_trie.insert(word)
+
+    prefixes = {word[:i] for word in words for i in range(len(word) + 1)}
+    prefixes |= {"x", "antz", "functions", "abcabcabc"}
+    for prefix in prefixes:
+        node, radix_node = trie.find(prefix), radix_trie.find(prefix)
+        if node is None:
+            assert radix_node is None, f"Should not find prefix '{prefix}'"
+            continue
+        assert radix_node.is_end_of_word == node.is_end_of_word
+        assert sorted(radix_node.suffixes()) == sorted(node.suffixes())
+
+
+def test_radix_trie_compresses_single_child_chains():
+    radix_trie = RadixTrie()
+    radix_trie.insert("function")
+    radix_trie.insert("fun")
+    fun_node = radix_trie.root.children["f"]
+    assert fun_node.label == "fun"
+    assert fun_node.is_end_of_word
+    assert fun_node.children["c"].label == "ction"
+    assert fun_node.children["c"].children is None
+
+
+def test_iter_suffixes_is_lazy_and_limited():
+    trie = Trie()
+    for word in ["hack", "hackerrank", "ham", "hammer", "hammock"]:
+        trie.insert(word)
+    node = trie.find("ha")
+    assert list(node.iter_suffixes()) == node.suffixes()
+    assert node.suffixes(limit=2) == node.suffixes()[:2]
+    assert next(node.iter_suffixes("ha")) == "hack"
+    assert node.suffixes(limit=0) == []
+
+
+def test_suffixes_of_very_long_word():
+    trie = Trie()
+    word = "a" * 5000
+    trie.insert(word)
+    assert trie.root.suffixes() == [word]
+
+
+def test_top_k_ranks_by_weight():
+    trie = Trie()
+    weights = {"hack": 5, "hackerrank": 9, "ham": 1, "hammer": 9, "hammock": 3}
+    for word, weight in weights.items():
+        trie.insert(word, weight)
+    trie.insert("ham", 2)  # repeated inserts add up
+
+    assert trie.root.top_k(3) == [("hackerrank", 9), ("hammer", 9), ("hack", 5)]
+    assert trie.find("ham").top_k(2, "ham") == [("hammer", 9), ("ham", 3)]
+    assert len(trie.root.top_k(10)) == len(weights)
+
+
+def _assert_same_completions(trie, frozen, prefixes):
+    for prefix in prefixes:
+        node, frozen_node = trie.find(prefix), frozen.find(prefix)
+        if node is None:
+            assert frozen_node is None, f"Should not find prefix '{prefix}'"
+            continue
+        assert frozen_node.is_end_of_word == node.is_end_of_word
+        assert list(frozen_node.children) == list(node.children)
+        assert frozen_node.suffixes() == node.suffixes()
+        assert frozen_node.top_k(3) == node.top_k(3)
+
+
+def test_frozen_trie_matches_trie():
+    trie = Trie()
+    words = ["hack", "hackerrank", "ham", "hammer", "hammock", "é", "ünïcode"]
+    for weight, word in enumerate(words):
+        trie.insert(word, weight)
+    frozen = trie.freeze()
+    prefixes = ["", "h", "ha", "hac", "ham", "hamm", "hx", "é", "ü", "hammers"]
+    _assert_same_completions(trie, frozen, prefixes)
+
+
+def test_frozen_trie_save_and_load(tmp_path):
+    trie = Trie()
+    for word in ["ant", "anthology", "antagonist", "antonym", "fun", "function"]:
+        trie.insert(word)
+    path = tmp_path / "trie.bin"
+    trie.freeze().save(path)
+
+    with FrozenTrie.load(path) as frozen:
+        _assert_same_completions(trie, frozen, ["", "a", "ant", "fun", "f", "z"])
+
+
+def test_frozen_trie_empty_and_invalid():
+    assert Trie().freeze().root.suffixes() == []
+    with pytest.raises(ValueError):
+        FrozenTrie(b"NOPE\x00\x00\x00\x00")
+
+
+def _distinct_nodes(root):
+    seen = {id(root): root}
+    stack = [root]
+    while stack:
+        for child in stack.pop().children.values():
+            if id(child) not in seen:
+                seen[id(child)] = child
+                stack.append(child)
+    return len(seen)
+
+
+def test_from_sorted_matches_trie():
+    words = sorted(["hack", "hackerrank", "ham", "hammer", "hammock", "", "h"])
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    dawg = Trie.from_sorted(words + words[-1:])  # a duplicate is ignored
+
+    for prefix in ["", "h", "ha", "hac", "ham", "hamm", "hx", "hammers"]:
+        node, dawg_node = trie.find(prefix), dawg.find(prefix)
+        if node is None:
+            assert dawg_node is None, f"Should not find prefix '{prefix}'"
+        else:
+            assert dawg_node.suffixes() == node.suffixes()
+
+
+def test_from_sorted_shares_suffixes():
+    words = ["baking", "eating", "making", "taking"]
+    dawg = Trie.from_sorted(words)
+    assert dawg.find("bak") is dawg.find("mak")
+    # root, then one node per distinct remaining suffix: "aking", "ating",
+    # "king", "ting", "ing", "ng", "g" and ""
+    assert _distinct_nodes(dawg.root) == 9
+
+
+def test_from_sorted_is_read_only_and_needs_sorted_input():
+    with pytest.raises(ValueError):
+        Trie.from_sorted(["b", "a"])
+    with pytest.raises(TypeError):
+        Trie.from_sorted(["a"]).insert("b")
+
+
+def _levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j in range(1, len(b) + 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, previous + (char != b[j - 1])
+            )
+    return row[-1]
+
+
+def test_find_fuzzy_finds_mistyped_prefix():
+    trie = Trie()
+    for word in ["hack", "hackerrank", "ham", "hammer", "hammock"]:
+        trie.insert(word)
+
+    matches = trie.find_fuzzy("hsm", 1)
+    assert [(path, distance) for path, distance, _ in matches] == [("ham", 1)]
+    assert matches[0][2] is trie.find("ham")
+    assert trie.find_fuzzy("xyz", 1) == []
+    assert trie.find_fuzzy("ham", 0)[0][:2] == ("ham", 0)
+
+
+def test_complete_fuzzy_ranks_by_distance():
+    rng = random.Random(8)
+    words = set()
+    for _ in range(80):
+        words.add("".join(rng.choice("abc") for _ in range(rng.randrange(1, 6))))
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+
+    for prefix in ["ab", "cab", "bb", "a"]:
+        completions = trie.complete_fuzzy(prefix, 1)
+        expected = {
+            word: min(_levenshtein(word[:i], prefix) for i in range(len(word) + 1))
+            for word in words
+        }
+        expected = {word: d for word, d in expected.items() if d <= 1}
+        assert dict(completions) == expected
+        distances = [distance for _, distance in completions]
+        assert distances == sorted(distances)
+        assert trie.complete_fuzzy(prefix, 1, limit=3) == completions[:3]
+
+
+def test_concurrent_trie_matches_trie():
+    words = ["hack", "hackerrank", "ham", "hammer", "hammock", "ham"]
+    trie, concurrent = Trie(), ConcurrentTrie()
+    for word in words:
+        trie.insert(word, 2)
+    concurrent.insert_many(words[:3], 2)
+    concurrent.insert_many(words[3:], 2)
+    for prefix in ["", "h", "ha", "ham", "hack", "x"]:
+        node, concurrent_node = trie.find(prefix), concurrent.find(prefix)
+        if node is None:
+            assert concurrent_node is None
+        else:
+            assert concurrent_node.suffixes() == node.suffixes()
+            assert concurrent_node.top_k(2) == node.top_k(2)
+
+
+def test_concurrent_trie_keeps_old_versions_intact():
+    trie = ConcurrentTrie()
+    trie.insert("ham")
+    old_root = trie.root
+    trie.insert_many(["hammer", "hack"])
+    assert old_root.suffixes() == ["ham"]
+    assert sorted(trie.root.suffixes()) == ["hack", "ham", "hammer"]
+
+
+def test_concurrent_trie_stress():
+    trie = ConcurrentTrie()
+    words = [f"w{i:05d}" for i in range(3000)]
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        seen = 0
+        try:
+            while not done.is_set():
+                node = trie.find("w")
+                found = len(node.suffixes()) if node else 0
+                assert found >= seen, "Readers should never see words disappear"
+                seen = found
+        except Exception as error:
+            errors.append(error)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for start in range(0, len(words), 100):
+        trie.insert_many(words[start : start + 100])
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert trie.find("w").suffixes("w") == words
@@ -1,4 +1,13 @@
-from src.problem_6 import get_min_max
+import random
+from array import array
+
+from src.problem_6 import (
+    MinMaxSummary,
+    MinMaxWindow,
+    get_min_max,
+    get_min_max_file,
+    get_min_max_parallel,
+)
 
 
 def test_get_min_max_returns_0_2():
@@ -9,3 +18,68 @@ def test_get_min_max_returns_0_2():
 def test_get_min_max_returns_None():
     ints = []
     assert get_min_max(ints) is None
+
+
+def test_get_min_max_generator():
+    assert get_min_max(n for n in [3, -1, 7, 7, 2]) == (-1, 7)
+    assert get_min_max(iter([5])) == (5, 5)
+    assert get_min_max(n for n in []) is None
+
+
+def test_get_min_max_buffers():
+    assert get_min_max(array("q", [4, -9, 12])) == (-9, 12)
+    assert get_min_max(bytes([9, 0, 200])) == (0, 200)
+    assert get_min_max(array("q")) is None
+
+
+def test_get_min_max_pairwise_matches_builtins():
+    rng = random.Random(6)
+    for size in range(1, 12):
+        ints = [rng.randrange(-50, 50) for _ in range(size)]
+        assert get_min_max(iter(ints)) == (min(ints), max(ints))
+
+
+def test_min_max_window_matches_get_min_max():
+    rng = random.Random(9)
+    values = [rng.randrange(-100, 100) for _ in range(300)]
+    for size in (1, 3, 10, 500):
+        window = MinMaxWindow(size)
+        assert window.get_min_max() is None
+        for i, value in enumerate(values):
+            window.push(value)
+            expected = get_min_max(values[max(0, i + 1 - size) : i + 1])
+            assert window.get_min_max() == expected
+
+
+def test_min_max_summary_merge():
+    rng = random.Random(10)
+    values = [rng.randrange(-100, 100) for _ in range(100)]
+    parts = [values[:30], values[30:30], values[30:70], values[70:]]
+    total = MinMaxSummary()
+    for part in parts:
+        total = total.merge(MinMaxSummary.from_values(part))
+    assert total.get_min_max() == get_min_max(values)
+    assert total.count == len(values)
+    assert MinMaxSummary.from_values(iter(values)) == total
+    assert MinMaxSummary().get_min_max() is None
+
+
+def test_get_min_max_parallel_matches_get_min_max():
+    rng = random.Random(12)
+    values = [rng.randrange(-(2**62), 2**62) for _ in range(1001)]
+    for workers in (1, 3, 8):
+        assert get_min_max_parallel(array("q", values), workers) == get_min_max(values)
+    assert get_min_max_parallel(array("q", values).tobytes(), 2) == get_min_max(values)
+    assert get_min_max_parallel(b"", 2) is None
+
+
+def test_get_min_max_file(tmp_path):
+    rng = random.Random(13)
+    values = [rng.randrange(-1000, 1000) for _ in range(999)]
+    path = tmp_path / "values.bin"
+    path.write_bytes(array("i", values).tobytes())
+    assert get_min_max_file(path, "i", workers=2) == get_min_max(values)
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert get_min_max_file(empty) is None
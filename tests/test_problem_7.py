@@ -52,3 +52,100 @@ def test_similar_paths(router):
     router.add_handler("/home/about/me", "about me handler")
     assert router.lookup("/home/about") == "about handler"
     assert router.lookup("/home/about/me") == "about me handler"
+
+
+def test_normalize_path():
+    assert normalize_path("") == "/"
+    assert normalize_path("/") == "/"
+    assert normalize_path("home//about/") == "/home/about"
+    assert normalize_path("//home///about//") == "/home/about"
+
+
+def test_duplicate_slashes_use_static_table(router):
+    assert router.lookup("//home//about//") == "about handler"
+    assert router.lookup("//") == "root handler"
+
+
+def test_compile_picks_up_direct_trie_inserts(router):
+    router.route_trie.insert("/home/about", "replaced handler")
+    assert router.lookup("/home/about") == "about handler"
+    router.compile()
+    assert router.lookup("/home/about") == "replaced handler"
+
+
+def test_path_parameters(router):
+    router.add_handler("/users/:id/orders", "orders handler")
+    assert router.match("/users/42/orders") == ("orders handler", {"id": "42"})
+    assert router.lookup("/users/42/orders/") == "orders handler"
+    assert router.lookup("/users/42") == "not found handler"
+    assert router.match("/users") == ("not found handler", {})
+
+
+def test_wildcard_captures_rest_of_path(router):
+    router.add_handler("/static/*path", "static handler")
+    assert router.match("/static/css/site.css") == (
+        "static handler",
+        {"path": "css/site.css"},
+    )
+    assert router.lookup("/static") == "not found handler"
+
+
+def test_static_beats_param_beats_wildcard(router):
+    router.add_handler("/users/me", "me handler")
+    router.add_handler("/users/:id", "user handler")
+    router.add_handler("/users/*rest", "users fallback")
+    assert router.match("/users/me") == ("me handler", {})
+    assert router.match("/users/7") == ("user handler", {"id": "7"})
+    assert router.match("/users/7/x") == ("users fallback", {"rest": "7/x"})
+
+
+def test_backtracks_one_level(router):
+    router.add_handler("/files/new", "new handler")
+    router.add_handler("/files/:name/raw", "raw handler")
+    # "new" matches the static child first, which has no "raw" below it
+    assert router.match("/files/new/raw") == ("raw handler", {"name": "new"})
+
+
+def test_invalid_dynamic_routes(router):
+    with pytest.raises(ValueError):
+        router.add_handler("/a/*rest/b", "handler")
+    with pytest.raises(ValueError):
+        router.add_handler("/a/:/b", "handler")
+    router.add_handler("/a/:id", "handler")
+    with pytest.raises(ValueError):
+        router.add_handler("/a/:name/b", "handler")
+
+
+@pytest.fixture
+def cached_router():
+    router = Router("root handler", "not found handler", cache_size=2)
+    router.add_handler("/home/about", "about handler")
+    router.add_handler("/users/:id", "user handler")
+    return router
+
+
+def test_cache_counts_hits_misses_and_evictions(cached_router):
+    assert cached_router.lookup("/home/about") == "about handler"
+    assert cached_router.lookup("/home/about") == "about handler"
+    assert cached_router.lookup("/nope") == "not found handler"
+    assert cached_router.lookup("/nope") == "not found handler"
+    assert (cached_router.hits, cached_router.misses) == (2, 2)
+    # "/home/about" is the least recently used and is evicted
+    assert cached_router.match("/users/1") == ("user handler", {"id": "1"})
+    assert cached_router.evictions == 1
+    assert cached_router.lookup("/home/about") == "about handler"
+    assert (cached_router.misses, cached_router.evictions) == (4, 2)
+
+
+def test_add_handler_invalidates_cache(cached_router):
+    assert cached_router.lookup("/home") == "not found handler"
+    cached_router.add_handler("/home", "home handler")
+    assert cached_router.lookup("/home") == "home handler"
+
+
+def test_cached_params_are_copied(cached_router):
+    _, params = cached_router.match("/users/1")
+    params["id"] = "changed"
+    assert cached_router.match("/users/1") == ("user handler", {"id": "1"})
+    cached_router.clear_cache()
+    assert (cached_router.hits, cached_router.misses) == (0, 0)